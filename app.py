@@ -3,11 +3,31 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import random
 import base64
 from PIL import Image
 import io
+import time
+
+from components.charts import create_pixel_gauge_grid, register_retro_template
+from utils.alerts import anomaly_alerts, evaluate_rules, format_alert, load_rules, rank_alerts
+from utils.anomaly import AnomalyEngine
+from utils.data_generator import generate_sample_property_data, generate_iot_sensor_data, generate_tenant_data
+from utils.downsampling import downsample_frame, target_points_for_width
+from utils.forecast import BASE_MONTHLY_REVENUE, STRATEGY_FACTORS, RevenueSweep, annual_revenue, revenue_bands, simulate_revenue, slider_values
+from utils.helpers import create_alert_box, encode_property_names, filter_properties_by_selection
+from utils.ingestion import IngestionPipeline, ReplaySource
+from utils.kpis import dataset_fingerprint, kpi_deltas, property_kpis, tenant_period_kpis
+from utils.occupancy_model import BASE_OCCUPANCY, IMPROVEMENT_OPTIONS, INPUTS as OCCUPANCY_INPUTS, OccupancySurface, occupancy_factors
+from utils.portfolio import PICKER_PAGE_SIZE, PortfolioEngine
+from utils.retention_model import load_or_train
+from utils.rollups import SensorRollupStore
+from utils.scenario_runner import ScenarioRunner
+from utils.schema import apply_schema, drop_unused_categories, memory_report
+from utils.sensor_history import SensorHistoryStore
+from utils.storage import dataset_key, dataset_path, date_filter, load_or_generate
 
 # ==== PAGE CONFIGURATION ====
 st.set_page_config(
@@ -17,6 +37,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ==== PLOTLY RETRO TEMPLATE ====
+# Registered once as the default template; charts are rendered with theme=None so
+# Streamlit's frontend theme does not override it
+register_retro_template(base="streamlit")
+
 # ==== CUSTOM CSS FOR RETRO GAMING AESTHETIC ====
 st.markdown("""
 <style>
@@ -120,106 +145,273 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ==== HELPER FUNCTIONS ====
+# ==== DATASET CACHE ====
+# Datasets are generated once per parameter set and persisted as Parquet (see
+# utils/storage.py); loads read back only the columns and partitions requested.
+# Loaded frames are shared across sessions and reruns. Entries are keyed by
+# parameters, seed and projection, expire after DATASET_CACHE_TTL seconds and at most
+# DATASET_CACHE_MAX_ENTRIES entries are kept per loader (oldest evicted first).
 
-def generate_sample_property_data(num_properties=10):
-    """Generate sample property data for demo purposes"""
-    property_types = ["Residential", "Commercial", "Retail", "Industrial", "Mixed-Use"]
-    cities = ["New York", "San Francisco", "Chicago", "Miami", "Austin", "Seattle", "Boston"]
-    
-    data = {
-        "property_id": [f"PROP-{i:03d}" for i in range(1, num_properties + 1)],
-        "name": [f"Property {chr(65 + i % 26)}{i}" for i in range(1, num_properties + 1)],
-        "type": [random.choice(property_types) for _ in range(num_properties)],
-        "location": [random.choice(cities) for _ in range(num_properties)],
-        "size_sqft": [random.randint(5000, 100000) for _ in range(num_properties)],
-        "occupancy_rate": [random.uniform(0.7, 1.0) for _ in range(num_properties)],
-        "revenue_per_sqft": [random.uniform(20, 100) for _ in range(num_properties)],
-        "energy_rating": [random.randint(50, 100) for _ in range(num_properties)],
-        "smart_devices": [random.randint(5, 50) for _ in range(num_properties)],
-        "maintenance_score": [random.randint(60, 100) for _ in range(num_properties)]
-    }
-    
-    return pd.DataFrame(data)
+DATASET_CACHE_TTL = 3600
+DATASET_CACHE_MAX_ENTRIES = 16
+DATA_SEED = 42
 
-def generate_iot_sensor_data(num_days=30, num_sensors=5):
-    """Generate sample IoT sensor data"""
-    date_range = [datetime.now() - timedelta(days=i) for i in range(num_days)]
-    date_range.reverse()
-    
-    sensor_types = ["Temperature", "Humidity", "Occupancy", "Energy", "Water"]
-    
-    data = []
-    for date in date_range:
-        for sensor_id in range(1, num_sensors + 1):
-            # Base values for each sensor type
-            if sensor_types[sensor_id-1] == "Temperature":
-                base_value = 72  # Fahrenheit
-                fluctuation = 5
-                unit = "°F"
-            elif sensor_types[sensor_id-1] == "Humidity":
-                base_value = 45  # Percent
-                fluctuation = 10
-                unit = "%"
-            elif sensor_types[sensor_id-1] == "Occupancy":
-                base_value = 65  # Percent
-                fluctuation = 20
-                unit = "%"
-            elif sensor_types[sensor_id-1] == "Energy":
-                base_value = 30  # kWh
-                fluctuation = 15
-                unit = "kWh"
-            else:  # Water
-                base_value = 120  # Gallons
-                fluctuation = 30
-                unit = "gal"
-            
-            # Add some time-based patterns and randomness
-            hour_factor = 1 + 0.2 * np.sin(2 * np.pi * date.hour / 24)
-            day_factor = 1 + 0.1 * np.sin(2 * np.pi * date.weekday() / 7)
-            random_factor = 1 + random.uniform(-0.1, 0.1)
-            
-            value = base_value * hour_factor * day_factor * random_factor
-            # Add a controlled fluctuation
-            value = value + random.uniform(-fluctuation, fluctuation)
-            
-            # Create anomalies occasionally (1% chance)
-            if random.random() < 0.01:
-                value = value * random.uniform(1.5, 2.0)
-            
-            data.append({
-                "date": date,
-                "sensor_id": f"S-{sensor_id:03d}",
-                "sensor_type": sensor_types[sensor_id-1],
-                "value": value,
-                "unit": unit,
-                "location": f"Zone-{random.randint(1, 3)}"
-            })
-    
-    return pd.DataFrame(data)
+NUM_PROPERTIES = 15
+NUM_IOT_DAYS = 30
+NUM_SENSORS = 5
+IOT_FREQ = "1D"  # Sensor sampling interval, e.g. "1min", "15min", "1h"
+NUM_TENANTS = 25
 
-def generate_tenant_data(num_tenants=20):
-    """Generate sample tenant data"""
-    business_types = ["Retail", "Office", "Restaurant", "Medical", "Tech", "Financial"]
-    lease_terms = [1, 2, 3, 5, 10]
-    
-    data = {
-        "tenant_id": [f"TEN-{i:03d}" for i in range(1, num_tenants + 1)],
-        "name": [f"Tenant {chr(65 + i % 26)}{i}" for i in range(1, num_tenants + 1)],
-        "business_type": [random.choice(business_types) for _ in range(num_tenants)],
-        "lease_term_years": [random.choice(lease_terms) for _ in range(num_tenants)],
-        "lease_start": [datetime.now() - timedelta(days=random.randint(30, 1000)) for _ in range(num_tenants)],
-        "monthly_rent": [random.randint(2000, 15000) for _ in range(num_tenants)],
-        "space_utilized_sqft": [random.randint(1000, 10000) for _ in range(num_tenants)],
-        "satisfaction_score": [random.randint(60, 100) for _ in range(num_tenants)],
-        "retention_probability": [random.uniform(0.6, 0.95) for _ in range(num_tenants)],
-        "service_requests_monthly": [random.randint(0, 10) for _ in range(num_tenants)]
-    }
-    
-    df = pd.DataFrame(data)
-    # Calculate lease end dates
-    df['lease_end'] = df.apply(lambda row: row['lease_start'] + timedelta(days=int(row['lease_term_years']*365)), axis=1)
-    return df
+LEASE_TIMELINE_MAX_TENANTS = 25  # Rows drawn in the lease expiration timeline
+
+IOT_CHART_POINTS = target_points_for_width()  # Max points sent per IoT time-series chart
+IOT_DOWNSAMPLE_MODE = "minmax"  # "minmax" keeps every bucket's peaks, "lttb" keeps the shape
+IOT_MARKER_LIMIT = 120  # Draw square markers only for short series
+IOT_COLUMNS = ("date", "sensor_type", "location", "value", "unit")  # Columns the pages and rollups read from storage
+IOT_REPLAY_DAYS = 7  # Stored history replayed by the live feed
+IOT_REFRESH_SECONDS = 5  # Rerun interval while the live feed is on
+LIVE_PAGES = ("🏢 Executive Dashboard", "🤖 IoT Systems")
+ALERT_LOOKBACK_DAYS = 7  # Anomalies considered for the Executive alerts
+PORTFOLIO_RANK_N = 15  # Properties in the Executive revenue comparison by default
+FORECAST_PATHS = 10_000  # Monte Carlo paths per revenue forecast
+FORECAST_HORIZONS = [12, 24, 36, 48, 60]  # Months
+RETENTION_TRAINING_TENANTS = 50_000  # Labelled tenant history the retention model trains on
+AT_RISK_RETENTION = 0.6  # Predicted retention below which a tenant is flagged
+GROWTH_RANGE = (-5.0, 10.0, 0.5)  # Min, max and step of the growth rate slider (%)
+OCCUPANCY_RANGE = (-10.0, 10.0, 1.0)  # Min, max and step of the occupancy change slider (%)
+
+# Chart colors for each sensor type
+SENSOR_COLORS = {
+    "Temperature": "#FF6B6B",  # Red for temperature
+    "Humidity": "#4ECDC4",  # Teal for humidity
+    "Occupancy": "#FFE66D",  # Yellow for occupancy
+    "Energy": "#9D65C9",  # Purple for energy
+    "Water": "#556270"  # Gray for water
+}
+
+# Display names of the retention model features
+RETENTION_FEATURE_LABELS = {
+    "satisfaction_score": "SATISFACTION",
+    "service_requests_monthly": "SERVICE REQUESTS",
+    "rent_per_sqft": "RENT PER SQFT",
+    "lease_term_years": "LEASE TERM",
+    "months_to_expiration": "MONTHS TO EXPIRY"
+}
+
+# Display names of the occupancy predictor inputs
+OCCUPANCY_INPUT_LABELS = {
+    "market_demand": "MARKET DEMAND",
+    "rental_adjustment": "RENTAL ADJUSTMENT",
+    "improvements": "IMPROVEMENTS",
+    "marketing_investment": "MARKETING"
+}
+
+# Chart colors for each pricing strategy
+STRATEGY_COLORS = {
+    "Conservative": "#4ECDC4",
+    "Balanced": "#FFE66D",
+    "Aggressive": "#FF6B6B"
+}
+
+# Chart colors for each property type
+PROPERTY_TYPE_COLORS = {
+    "Residential": "#FF6B6B",
+    "Commercial": "#4ECDC4",
+    "Retail": "#FFE66D",
+    "Industrial": "#556270",
+    "Mixed-Use": "#9D65C9"
+}
+
+def iot_dataset_key(num_days, num_sensors, freq, seed):
+    """Storage key of one IoT parameter set"""
+    # Readings end at generation time, so each day gets its own stored copy
+    return dataset_key(num_days=num_days, num_sensors=num_sensors, freq=freq, seed=seed, as_of=datetime.now().date())
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_property_data(num_properties=NUM_PROPERTIES, seed=DATA_SEED, columns=None):
+    """Load property data from columnar storage, generating it on first use"""
+    return load_or_generate(
+        "properties",
+        dataset_key(num_properties=num_properties, seed=seed),
+        lambda: generate_sample_property_data(num_properties, seed=seed),
+        columns
+    )
+
+def read_iot_sensor_data(num_days=NUM_IOT_DAYS, num_sensors=NUM_SENSORS, freq=IOT_FREQ, seed=DATA_SEED,
+                         columns=None, start_date=None, end_date=None):
+    """Read IoT sensor data from columnar storage, decoding only partitions inside [start_date, end_date]"""
+    return load_or_generate(
+        "iot",
+        iot_dataset_key(num_days, num_sensors, freq, seed),
+        lambda: generate_iot_sensor_data(num_days, num_sensors, freq, seed=seed),
+        columns,
+        date_filter(start_date, end_date)
+    )
+
+@st.cache_resource(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_iot_history(num_days=NUM_IOT_DAYS, num_sensors=NUM_SENSORS, freq=IOT_FREQ, seed=DATA_SEED):
+    """Open the memory-mapped IoT history, writing it from columnar storage on first use"""
+    path = dataset_path("iot_history", iot_dataset_key(num_days, num_sensors, freq, seed))
+    if not path.is_dir():
+        # Read uncached: the frame is only needed until its arrays are on disk
+        SensorHistoryStore.write(read_iot_sensor_data(num_days, num_sensors, freq, seed, columns=IOT_COLUMNS), path)
+    return SensorHistoryStore(path)
+
+@st.cache_resource(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_iot_rollups(num_days=NUM_IOT_DAYS, num_sensors=NUM_SENSORS, freq=IOT_FREQ, seed=DATA_SEED):
+    """Build the IoT rollup store once per dataset and share it across sessions"""
+    # Fed one memory-mapped series at a time, so the full history is never held as one frame
+    history = load_iot_history(num_days, num_sensors, freq, seed)
+    rollups = SensorRollupStore()
+    for sensor_type, location in history.series_keys():
+        rollups.update(history.frame(sensor_type, location))
+    return rollups
+
+@st.cache_resource(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_iot_feed(num_days=NUM_IOT_DAYS, num_sensors=NUM_SENSORS, freq=IOT_FREQ, seed=DATA_SEED):
+    """Live IoT feed replaying recent stored readings; pages read its rollups and anomaly engine"""
+    # Anomaly detectors start from the full history, backfilled one mapped series at a time
+    history = load_iot_history(num_days, num_sensors, freq, seed)
+    engine = AnomalyEngine()
+    for sensor_type, location in history.series_keys():
+        engine.backfill((sensor_type, location), *history.window(sensor_type, location))
+    
+    recent = read_iot_sensor_data(num_days, num_sensors, freq, seed, start_date=datetime.now() - timedelta(days=IOT_REPLAY_DAYS))
+    # Replayed readings are restamped to now and merged into the rollups and detectors as
+    # new readings; every session's rerun shares one poll per refresh interval
+    feed = IngestionPipeline(
+        ReplaySource(recent), load_iot_rollups(num_days, num_sensors, freq, seed), engine,
+        poll_interval=IOT_REFRESH_SECONDS
+    )
+    # Ring buffers start from the stored tail, so current-state lookups never scan history
+    feed.prime(recent)
+    return feed
+
+@st.cache_resource(show_spinner=False)
+def load_alert_rules():
+    """Alert rule table shared by every session"""
+    return load_rules()
+
+def poll_iot_feed(live=False):
+    """Shared live feed, pulling the next batch of readings when live and the feed is due"""
+    feed = load_iot_feed()
+    if live:
+        feed.poll()
+    return feed
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_tenant_data(num_tenants=NUM_TENANTS, seed=DATA_SEED, columns=None):
+    """Load tenant data from columnar storage, generating it on first use"""
+    # Lease timing is relative to generation time, so each day gets its own stored copy
+    return load_or_generate(
+        "tenants",
+        dataset_key(num_tenants=num_tenants, seed=seed, as_of=datetime.now().date()),
+        lambda: generate_tenant_data(num_tenants, seed=seed),
+        columns
+    )
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, show_spinner=False)
+def dataset_memory_report():
+    """Memory use of the loaded datasets against their uncompacted equivalents"""
+    return memory_report({
+        "properties": load_property_data(),
+        # Read uncached, so the full history is released once it has been measured
+        "iot": read_iot_sensor_data(columns=IOT_COLUMNS),
+        "tenants": load_tenant_data()
+    })
+
+# ==== QUERY LAYER ====
+# Sidebar filters are normalized into a hashable (start, end, properties) tuple and
+# pushed down to the sources (rollup and memory-mapped history windows for IoT
+# readings, integer-coded matching for properties). Results are cached per filter tuple, so
+# switching pages with the same filters is a cache hit and pages only receive the
+# rows they render.
+
+QUERY_CACHE_MAX_ENTRIES = 64
+
+def normalize_filters(date_range, selected_properties):
+    """Turn sidebar widget values into a hashable (start, end, properties) filter tuple"""
+    dates = [d for d in (date_range if isinstance(date_range, (list, tuple)) else [date_range]) if d]
+    if dates:
+        start_date = pd.Timestamp(dates[0])
+        # The end date is inclusive, so cover its whole day
+        end_date = pd.Timestamp(dates[-1]) + pd.Timedelta(days=1) - pd.Timedelta(1, unit="ns")
+    else:
+        start_date = end_date = None
+    return start_date, end_date, tuple(sorted(selected_properties or []))
+
+@st.cache_resource(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_property_source(num_properties=NUM_PROPERTIES, seed=DATA_SEED):
+    """Shared property source with integer-coded names"""
+    return encode_property_names(load_property_data(num_properties, seed))
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=QUERY_CACHE_MAX_ENTRIES, show_spinner=False)
+def query_property_data(selected_properties=()):
+    """Properties matching the sidebar property selection (all when empty)"""
+    return drop_unused_categories(filter_properties_by_selection(load_property_source(), list(selected_properties)))
+
+@st.cache_resource(ttl=DATASET_CACHE_TTL, max_entries=QUERY_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_portfolio(selected_properties=()):
+    """Portfolio engine over the properties matching the sidebar selection"""
+    return PortfolioEngine(query_property_data(selected_properties))
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=QUERY_CACHE_MAX_ENTRIES, show_spinner=False)
+def query_fingerprint(name, selected_properties=()):
+    """Content fingerprint of the properties matching a selection, or of the tenants"""
+    return dataset_fingerprint(query_property_data(selected_properties) if name == "properties" else load_scored_tenant_data())
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=QUERY_CACHE_MAX_ENTRIES, show_spinner=False)
+def query_kpis(name, selected_properties, fingerprint, as_of, _df):
+    """(headline kpis, percent deltas against the prior period) of one dataset version and filter on a date"""
+    if name == "properties":
+        # Properties carry no dates, so there is no prior period to compare against
+        return property_kpis(_df), {}
+    kpis, prior = tenant_period_kpis(_df, as_of)
+    return kpis, kpi_deltas(kpis, prior)
+
+# ==== FORECASTS ====
+# Simulations are cached per input combination, so moving a slider back to an
+# earlier value redraws from the cache.
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=QUERY_CACHE_MAX_ENTRIES, show_spinner=False)
+def simulate_revenue_forecast(growth_rate, occupancy_change, pricing_strategy, horizon, run=0):
+    """(P10/P50/P90 monthly bands, first-year revenue percentiles) of one forecast scenario"""
+    paths = simulate_revenue(
+        growth_rate, occupancy_change, STRATEGY_FACTORS[pricing_strategy], horizon, FORECAST_PATHS, seed=(DATA_SEED, run)
+    )
+    return revenue_bands(paths), annual_revenue(paths)
+
+@st.cache_resource(ttl=DATASET_CACHE_TTL, show_spinner=False)
+def load_retention_model(num_tenants=RETENTION_TRAINING_TENANTS, seed=DATA_SEED):
+    """Retention model trained once on a labelled tenant history and persisted"""
+    # The history is only needed for the fit, so it is generated in memory, not stored
+    key = dataset_key(num_tenants=num_tenants, seed=seed)
+    return load_or_train(key, lambda: generate_tenant_data(num_tenants, seed=seed), seed)
+
+@st.cache_data(ttl=DATASET_CACHE_TTL, max_entries=DATASET_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_scored_tenant_data(num_tenants=NUM_TENANTS, seed=DATA_SEED):
+    """Tenant data whose retention_probability is the retention model's prediction"""
+    tenants_df = load_tenant_data(num_tenants, seed)
+    return apply_schema(tenants_df.assign(retention_probability=load_retention_model().score(tenants_df)), "tenants")
+
+@st.cache_resource(show_spinner=False)
+def load_scenario_runner():
+    """Scenario runner whose worker pool is shared by every session and run"""
+    return ScenarioRunner()
+
+@st.cache_resource(show_spinner=False)
+def load_occupancy_surface(base_occupancy=BASE_OCCUPANCY):
+    """Occupancy prediction for every input combination around one base occupancy"""
+    return OccupancySurface(base_occupancy)
+
+@st.cache_resource(show_spinner=False)
+def load_revenue_sweep():
+    """Expected forecast of every slider combination up to the longest horizon"""
+    return RevenueSweep(
+        slider_values(*GROWTH_RANGE), slider_values(*OCCUPANCY_RANGE), tuple(STRATEGY_FACTORS), FORECAST_HORIZONS[-1]
+    )
+
+# ==== HELPER FUNCTIONS ====
 
 def create_pixel_art_header():
     """Creates a pixel art header for the dashboard"""
@@ -232,6 +424,16 @@ def create_pixel_art_header():
     </div>
     """, unsafe_allow_html=True)
 
+def property_search_page(portfolio, label, key, container=st):
+    """Searchable, paginated property names; returns the names on the current page"""
+    query = container.text_input(label, key=f"{key}_query", placeholder="NAME CONTAINS...")
+    total = len(portfolio.matches(query))
+    pages = max(1, -(-total // PICKER_PAGE_SIZE))
+    page = container.number_input(f"PAGE (1-{pages})", 1, pages, 1, key=f"{key}_page_{query}") - 1
+    names, _ = portfolio.search(query, page)
+    container.caption(f"{total:,} MATCHES")
+    return names["name"].astype(str).tolist()
+
 def create_game_menu():
     """Creates a retro game-like menu in the sidebar"""
     st.sidebar.markdown("""
@@ -269,13 +471,19 @@ def create_game_menu():
         max_value=datetime.now()
     )
     
-    # Property filter as a game-like dropdown
-    properties_df = generate_sample_property_data()
+    # Property filter as a game-like dropdown; options are one search page plus the
+    # current selection, so the widget never lists the whole portfolio
+    portfolio = load_portfolio()
+    selection = st.session_state.get("selected_properties")
+    if selection is None:
+        selection = portfolio.search(page_size=3)[0]["name"].astype(str).tolist()
+    matches = property_search_page(portfolio, "FIND PROPERTIES", "sidebar_property", st.sidebar)
     selected_properties = st.sidebar.multiselect(
         "SELECT PROPERTIES",
-        options=properties_df["name"].tolist(),
-        default=properties_df["name"].tolist()[:3]
+        options=selection + [name for name in matches if name not in selection],
+        default=selection
     )
+    st.session_state["selected_properties"] = selected_properties
     
     # Add a power button style control
     st.sidebar.markdown("""
@@ -298,7 +506,27 @@ def create_game_menu():
     </div>
     """, unsafe_allow_html=True)
     
-    return menu_selection, date_range, selected_properties
+    # Stream new sensor readings into the Executive and IoT pages
+    live_feed = st.sidebar.checkbox("📡 LIVE SENSOR FEED", value=False)
+    
+    # Footprint of the compact dataset schemas next to object/float64/int64 columns.
+    # Expander bodies run on every rerun, so the datasets are only loaded on request
+    with st.sidebar.expander("💾 DATASET MEMORY"):
+        if st.button("MEASURE", key="measure_memory"):
+            st.session_state["memory_report"] = dataset_memory_report()
+        report = st.session_state.get("memory_report")
+        if report is not None:
+            st.dataframe(
+                report.assign(
+                    memory_mb=report["memory_mb"].round(2),
+                    wide_memory_mb=report["wide_memory_mb"].round(2),
+                    saving_pct=report["saving_pct"].round(0)
+                ).rename(columns=str.upper),
+                hide_index=True,
+                use_container_width=True
+            )
+    
+    return menu_selection, date_range, selected_properties, live_feed
 
 def pixel_style_metric(label, value, delta=None, color="#4ECDC4"):
     """Display a metric in pixel art style"""
@@ -323,207 +551,165 @@ def pixel_style_metric(label, value, delta=None, color="#4ECDC4"):
     """
     return html
 
-def create_executive_dashboard(properties_df, iot_df, tenants_df):
+def create_executive_dashboard(properties_df, tenants_df, feed=None, portfolio=None, property_filter=()):
     """Create the executive dashboard with retro gaming aesthetic"""
+    if portfolio is None:
+        portfolio = PortfolioEngine(properties_df)
+    if feed is None:
+        feed = load_iot_feed()
     st.markdown("<h2>EXECUTIVE COMMAND CENTER</h2>", unsafe_allow_html=True)
     
     # Key Metrics in Retro Gaming Style
     col1, col2, col3, col4 = st.columns(4)
     
-    avg_occupancy = f"{round(properties_df['occupancy_rate'].mean() * 100)}%"
-    avg_energy = f"{round(properties_df['energy_rating'].mean())}/100"
-    total_revenue = f"${round(sum(properties_df['revenue_per_sqft'] * properties_df['size_sqft']) / 1000)}K"
-    tenant_satisfaction = f"{round(tenants_df['satisfaction_score'].mean())}/100"
+    # Headline metrics and deltas against the prior period, memoized per dataset version and filter
+    today = pd.Timestamp(datetime.now().date())
+    property_metrics, property_deltas = query_kpis(
+        "properties", property_filter, query_fingerprint("properties", property_filter), today, properties_df
+    )
+    tenant_metrics, tenant_deltas = query_kpis("tenants", (), query_fingerprint("tenants"), today, tenants_df)
+    
+    avg_occupancy = f"{round(property_metrics['occupancy'] * 100)}%"
+    avg_energy = f"{round(property_metrics['energy_rating'])}/100"
+    total_revenue = f"${round(property_metrics['revenue'] / 1000)}K"
+    tenant_satisfaction = f"{round(tenant_metrics['satisfaction'])}/100"
     
     with col1:
-        st.markdown(pixel_style_metric("Occupancy", avg_occupancy, 5, "#FF6B6B"), unsafe_allow_html=True)
+        st.markdown(pixel_style_metric("Occupancy", avg_occupancy, property_deltas.get("occupancy"), "#FF6B6B"), unsafe_allow_html=True)
     with col2:
-        st.markdown(pixel_style_metric("Energy Rating", avg_energy, -2, "#4ECDC4"), unsafe_allow_html=True)
+        st.markdown(pixel_style_metric("Energy Rating", avg_energy, property_deltas.get("energy_rating"), "#4ECDC4"), unsafe_allow_html=True)
     with col3:
-        st.markdown(pixel_style_metric("Revenue", total_revenue, 8, "#FFE66D"), unsafe_allow_html=True)
+        st.markdown(pixel_style_metric("Revenue", total_revenue, property_deltas.get("revenue"), "#FFE66D"), unsafe_allow_html=True)
     with col4:
-        st.markdown(pixel_style_metric("Tenant Score", tenant_satisfaction, 3, "#556270"), unsafe_allow_html=True)
+        st.markdown(pixel_style_metric("Tenant Score", tenant_satisfaction, tenant_deltas["satisfaction"], "#556270"), unsafe_allow_html=True)
 
     st.markdown("<hr>", unsafe_allow_html=True)
     
     # Portfolio Overview with pixel art style
     st.markdown("<h3>PROPERTY PORTFOLIO OVERVIEW</h3>", unsafe_allow_html=True)
     
+    # Drill down portfolio -> city -> type, then rank the properties under that node
+    cities = ["ALL"] + [str(city) for city in portfolio.labels["location"]]
+    types = ["ALL"] + [str(property_type) for property_type in portfolio.labels["type"]]
+    drill_cols = st.columns(4)
+    with drill_cols[0]:
+        city = st.selectbox("CITY", cities)
+    with drill_cols[1]:
+        property_type = st.selectbox("TYPE", types)
+    with drill_cols[2]:
+        ranking = st.radio("RANKING", ["TOP", "BOTTOM"], horizontal=True)
+    with drill_cols[3]:
+        rank_n = st.slider("PROPERTIES", 5, 50, PORTFOLIO_RANK_N)
+    
+    ranked = portfolio.rank(
+        rank_n,
+        by="revenue_per_sqft",
+        bottom=ranking == "BOTTOM",
+        city=None if city == "ALL" else city,
+        property_type=None if property_type == "ALL" else property_type
+    )
+    
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Create a property comparison bar chart with retro colors
         fig = px.bar(
-            properties_df,
+            drop_unused_categories(ranked),
             x="name",
             y="revenue_per_sqft",
             color="type",
-            color_discrete_map={
-                "Residential": "#FF6B6B",
-                "Commercial": "#4ECDC4",
-                "Retail": "#FFE66D",
-                "Industrial": "#556270",
-                "Mixed-Use": "#9D65C9"
-            },
-            title="PROPERTY REVENUE COMPARISON",
+            color_discrete_map=PROPERTY_TYPE_COLORS,
+            title=f"{ranking} {len(ranked)} PROPERTY REVENUE COMPARISON",
             labels={"name": "PROPERTY", "revenue_per_sqft": "$ PER SQFT", "type": "TYPE"}
         )
+        fig.update_xaxes(categoryorder="array", categoryarray=ranked["name"].astype(str).tolist())
         
-        # Make it more retro by changing the layout
-        fig.update_layout(
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=24, color="white"),
-            legend_title_font=dict(family="VT323", size=12),
-            legend_font=dict(family="VT323", size=12),
-            xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
-            yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323"))
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
     
     with col2:
-        # Property type distribution with a pixel-style pie chart
+        # Property type distribution from the aggregated hierarchy, one slice per type
+        type_counts = portfolio.aggregate("type").groupby(level="type", observed=True)["properties"].sum().reset_index()
         fig = px.pie(
-            properties_df, 
-            names="type", 
+            type_counts,
+            names="type",
+            values="properties",
             title="PROPERTY TYPE DISTRIBUTION",
             color="type",
-            color_discrete_map={
-                "Residential": "#FF6B6B",
-                "Commercial": "#4ECDC4",
-                "Retail": "#FFE66D",
-                "Industrial": "#556270",
-                "Mixed-Use": "#9D65C9"
-            },
-        )
-        
-        fig.update_layout(
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=24, color="white"),
-            legend_font=dict(family="VT323", size=12)
+            color_discrete_map=PROPERTY_TYPE_COLORS,
         )
         
         fig.update_traces(textfont=dict(family="VT323", size=14))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
+    
+    # Revenue by city and type; every node sums the properties below it
+    hierarchy = portfolio.hierarchy()
+    fig = go.Figure(go.Treemap(
+        ids=hierarchy["id"],
+        parents=hierarchy["parent"],
+        labels=hierarchy["label"],
+        values=hierarchy["revenue"],
+        branchvalues="total",
+        customdata=hierarchy[["properties", "occupancy_rate"]],
+        hovertemplate="%{label}<br>$%{value:,.0f}<br>%{customdata[0]:,} properties<br>%{customdata[1]:.0%} occupied<extra></extra>",
+        marker=dict(colorscale=[[0, "#556270"], [0.5, "#4ECDC4"], [1, "#FFE66D"]], line=dict(color="black", width=2))
+    ))
+    fig.update_layout(title="PORTFOLIO REVENUE BY CITY AND TYPE", margin=dict(t=50, l=10, r=10, b=10))
+    st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # IoT Analytics Overview
     st.markdown("<h3>SMART BUILDING SYSTEMS STATUS</h3>", unsafe_allow_html=True)
     
-    # Filter IoT data for the most recent date
-    latest_date = iot_df["date"].max()
-    latest_iot = iot_df[iot_df["date"] == latest_date]
-    
-    # Create columns for sensor values
-    sensor_cols = st.columns(5)
-    
-    for i, (idx, row) in enumerate(latest_iot.iterrows()):
-        with sensor_cols[i]:
-            # Create a game-like gauge with pixelated style
-            if row["sensor_type"] == "Temperature":
-                color = "#FF6B6B"  # Red for temperature
-            elif row["sensor_type"] == "Humidity":
-                color = "#4ECDC4"  # Teal for humidity
-            elif row["sensor_type"] == "Occupancy":
-                color = "#FFE66D"  # Yellow for occupancy
-            elif row["sensor_type"] == "Energy":
-                color = "#9D65C9"  # Purple for energy
-            else:  # Water
-                color = "#556270"  # Gray for water
-            
-            # Create a pixelated gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=row["value"],
-                domain={"x": [0, 1], "y": [0, 1]},
-                title={"text": row["sensor_type"], "font": {"family": "VT323", "size": 24}},
-                gauge={
-                    "axis": {"range": [0, row["value"] * 1.5], "tickfont": {"family": "VT323"}},
-                    "bar": {"color": color},
-                    "bgcolor": "white",
-                    "borderwidth": 2,
-                    "bordercolor": "black",
-                    "steps": [
-                        {"range": [0, row["value"] * 0.5], "color": "lightgray"},
-                        {"range": [row["value"] * 0.5, row["value"]], "color": color}
-                    ],
-                },
-                number={"font": {"family": "VT323", "size": 40}, "suffix": row["unit"]}
-            ))
-            
-            fig.update_layout(
-                height=200,
-                plot_bgcolor="#2A2A72",
-                paper_bgcolor="#2A2A72",
-                font={"family": "VT323", "color": "white"},
-                margin=dict(l=30, r=30, t=50, b=30)
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+    # Latest reading per sensor from the feed's ring buffers
+    latest_iot = feed.latest()
     
-    # Alerts Section styled as game notifications
-    st.markdown("<h3>SYSTEM ALERTS</h3>", unsafe_allow_html=True)
+    # Render every sensor gauge in one batched figure
+    gauges = [
+        {
+            "value": row.value,
+            "title": row.sensor_type,
+            "color": SENSOR_COLORS.get(row.sensor_type, "#556270"),
+            "suffix": row.unit
+        }
+        for row in latest_iot.itertuples(index=False)
+    ]
     
-    alert_cols = st.columns(3)
+    if gauges:
+        st.plotly_chart(create_pixel_gauge_grid(gauges, columns=5), use_container_width=True, theme=None)
     
-    with alert_cols[0]:
-        st.markdown("""
-        <div style="background-color: #FF6B6B; border: 3px solid black; padding: 10px; box-shadow: 4px 4px 0px black;">
-            <h4 style="text-align: center; margin: 0; color: white;">CRITICAL ALERT</h4>
-            <p style="text-align: center; margin: 10px 0; color: white; font-size: 16px;">
-                Temperature spike detected in Zone-2.<br>+8°F above normal range.
-            </p>
-            <div style="text-align: center;">
-                <button style="font-family: 'VT323'; background-color: black; color: white; border: none; padding: 5px 15px;">
-                    INVESTIGATE
-                </button>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Alerts Section styled as game notifications
+    st.markdown("<h3>SYSTEM ALERTS</h3>", unsafe_allow_html=True)
     
-    with alert_cols[1]:
-        st.markdown("""
-        <div style="background-color: #FFE66D; border: 3px solid black; padding: 10px; box-shadow: 4px 4px 0px black;">
-            <h4 style="text-align: center; margin: 0; color: black;">WARNING</h4>
-            <p style="text-align: center; margin: 10px 0; color: black; font-size: 16px;">
-                Energy consumption 15% above<br>baseline in Property B2.
-            </p>
-            <div style="text-align: center;">
-                <button style="font-family: 'VT323'; background-color: black; color: white; border: none; padding: 5px 15px;">
-                    OPTIMIZE
-                </button>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Rule alerts over the hourly rollups ranked together with recent detector anomalies
+    rule_alerts = evaluate_rules(load_alert_rules(), feed.rollups.snapshot("hourly"))
+    anomalies = feed.engine.recent(since=datetime.now() - timedelta(days=ALERT_LOOKBACK_DAYS))
+    alerts = rank_alerts(rule_alerts, anomaly_alerts(anomalies), limit=3)
     
-    with alert_cols[2]:
-        st.markdown("""
-        <div style="background-color: #4ECDC4; border: 3px solid black; padding: 10px; box-shadow: 4px 4px 0px black;">
-            <h4 style="text-align: center; margin: 0; color: white;">INFO</h4>
-            <p style="text-align: center; margin: 10px 0; color: white; font-size: 16px;">
-                3 maintenance requests<br>pending assignment.
-            </p>
-            <div style="text-align: center;">
-                <button style="font-family: 'VT323'; background-color: black; color: white; border: none; padding: 5px 15px;">
-                    SCHEDULE
-                </button>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    if alerts.empty:
+        st.markdown(create_alert_box("ALL CLEAR", "No alert rules fired and no sensor anomalies<br>detected in the last week.", "#4ECDC4"), unsafe_allow_html=True)
+    else:
+        alert_cols = st.columns(3)
+        for alert_col, alert in zip(alert_cols, alerts.itertuples(index=False)):
+            title, message, color = format_alert(alert, feed.rollups.units.get(alert.sensor_type, ""))
+            with alert_col:
+                st.markdown(create_alert_box(title, message, color, "INVESTIGATE"), unsafe_allow_html=True)
 
-def create_property_analytics(properties_df):
+def create_property_analytics(properties_df, portfolio=None):
     """Create the property analytics page with retro gaming aesthetic"""
     st.markdown("<h2>PROPERTY ANALYTICS POWER-UP</h2>", unsafe_allow_html=True)
     
-    # Property selector as a game control
-    selected_property = st.selectbox(
-        "SELECT PROPERTY TO ANALYZE",
-        options=properties_df["name"].tolist()
-    )
+    if portfolio is None:
+        portfolio = PortfolioEngine(properties_df)
+    
+    # Property selector as a game control, searching and paging through the portfolio
+    search_col, select_col = st.columns([1, 2])
+    with search_col:
+        names = property_search_page(portfolio, "SEARCH PROPERTIES", "analytics_property")
+    with select_col:
+        selected_property = st.selectbox("SELECT PROPERTY TO ANALYZE", options=names)
+    if selected_property is None:
+        st.info("No properties match the search.")
+        return
     
     # Get property data
     prop_data = properties_df[properties_df["name"] == selected_property].iloc[0]
@@ -685,17 +871,10 @@ def create_property_analytics(properties_df):
         fig.update_layout(
             title="MONTHLY PERFORMANCE (IN $K)",
             barmode="group",
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=20, color="white"),
-            legend_title_font=dict(family="VT323"),
-            legend_font=dict(family="VT323", size=12),
-            xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
-            yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
+            title_font=dict(size=20),
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Recommendations section styled as power-ups
     st.markdown("<h3>PROPERTY POWER-UPS AVAILABLE</h3>", unsafe_allow_html=True)
@@ -804,8 +983,9 @@ def create_property_analytics(properties_df):
         </div>
         """, unsafe_allow_html=True)
 
-def create_iot_dashboard(iot_df):
+def create_iot_dashboard(feed, start_date=None, end_date=None):
     """Create the IoT monitoring dashboard with retro gaming aesthetic"""
+    rollups = feed.rollups
     st.markdown("<h2>IoT CONTROL STATION</h2>", unsafe_allow_html=True)
     
     # Filter options that look like game controls
@@ -814,51 +994,55 @@ def create_iot_dashboard(iot_df):
     with col1:
         sensor_type = st.selectbox(
             "SELECT SENSOR TYPE",
-            options=sorted(iot_df["sensor_type"].unique())
+            options=rollups.sensor_types()
         )
     
     with col2:
         location = st.selectbox(
             "SELECT ZONE",
-            options=sorted(iot_df["location"].unique())
+            options=rollups.locations()
         )
     
-    # Filter IoT data
-    filtered_iot = iot_df[
-        (iot_df["sensor_type"] == sensor_type) & 
-        (iot_df["location"] == location)
-    ]
-    
-    # Group by date and calculate average
-    daily_avg = filtered_iot.groupby(filtered_iot["date"].dt.date)["value"].mean().reset_index()
+    # Daily averages and stats come straight from the pre-aggregated rollups
+    daily_avg = rollups.series(sensor_type, location, "daily", start_date, end_date)
+    if daily_avg.empty:
+        st.markdown("""
+        <div style="
+            background-color: #FFD166;
+            border: 3px solid black;
+            box-shadow: 4px 4px 0px black;
+            padding: 15px;
+            margin-top: 10px;
+            text-align: center;
+        ">
+            <h4 style="margin: 0;">NO SENSOR DATA IN SELECTED TIMEFRAME</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    daily_avg["date"] = daily_avg["bucket"].dt.date
     daily_avg["date_str"] = daily_avg["date"].astype(str)
+    sensor_stats = rollups.stats(sensor_type, location, start_date, end_date)
+    
+    # Decimate long series server-side so the payload stays bounded by chart width
+    chart_data = downsample_frame(daily_avg, "date", "value", IOT_CHART_POINTS, IOT_DOWNSAMPLE_MODE)
     
     # Create pixel-style time series chart
     st.markdown("<h3>SENSOR READINGS OVER TIME</h3>", unsafe_allow_html=True)
     
     # Get unit for the selected sensor type
-    unit = filtered_iot["unit"].iloc[0] if not filtered_iot.empty else ""
+    unit = rollups.units.get(sensor_type, "")
     
     # Determine color based on sensor type
-    if sensor_type == "Temperature":
-        color = "#FF6B6B"  # Red for temperature
-    elif sensor_type == "Humidity":
-        color = "#4ECDC4"  # Teal for humidity
-    elif sensor_type == "Occupancy":
-        color = "#FFE66D"  # Yellow for occupancy
-    elif sensor_type == "Energy":
-        color = "#9D65C9"  # Purple for energy
-    else:  # Water
-        color = "#556270"  # Gray for water
+    color = SENSOR_COLORS.get(sensor_type, "#556270")
     
     # Create a pixel-like line chart
     fig = go.Figure()
     
     # Add line trace with square markers for pixel effect
     fig.add_trace(go.Scatter(
-        x=daily_avg["date_str"],
-        y=daily_avg["value"],
-        mode="lines+markers",
+        x=chart_data["date_str"],
+        y=chart_data["value"],
+        mode="lines+markers" if len(chart_data) <= IOT_MARKER_LIMIT else "lines",
         line=dict(color=color, width=3, shape="hv"),  # Step-like lines for pixel effect
         marker=dict(size=8, symbol="square"),
         name=sensor_type
@@ -890,25 +1074,17 @@ def create_iot_dashboard(iot_df):
     # Update layout for retro gaming aesthetic
     fig.update_layout(
         title=f"{sensor_type.upper()} READINGS IN {location}",
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=24, color="white"),
         xaxis=dict(
             title="DATE",
-            gridcolor="#556270",
-            tickfont=dict(family="VT323"),
             tickangle=45
         ),
         yaxis=dict(
-            title=f"{sensor_type.upper()} ({unit})",
-            gridcolor="#556270",
-            tickfont=dict(family="VT323")
+            title=f"{sensor_type.upper()} ({unit})"
         ),
         margin=dict(l=50, r=50, t=80, b=50)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Detailed sensor statistics in pixelated cards
     st.markdown("<h3>SENSOR STATS</h3>", unsafe_allow_html=True)
@@ -916,33 +1092,26 @@ def create_iot_dashboard(iot_df):
     stat_cols = st.columns(4)
     
     with stat_cols[0]:
-        current_value = filtered_iot.iloc[-1]["value"] if not filtered_iot.empty else 0
+        current_value = feed.current(sensor_type, location, sensor_stats["current"])
         st.markdown(pixel_style_metric("CURRENT VALUE", f"{current_value:.1f} {unit}", None, color), unsafe_allow_html=True)
     
     with stat_cols[1]:
-        avg_value = filtered_iot["value"].mean() if not filtered_iot.empty else 0
+        avg_value = sensor_stats["mean"]
         st.markdown(pixel_style_metric("AVERAGE", f"{avg_value:.1f} {unit}", None, color), unsafe_allow_html=True)
     
     with stat_cols[2]:
-        min_value = filtered_iot["value"].min() if not filtered_iot.empty else 0
+        min_value = sensor_stats["min"]
         st.markdown(pixel_style_metric("MINIMUM", f"{min_value:.1f} {unit}", None, color), unsafe_allow_html=True)
     
     with stat_cols[3]:
-        max_value = filtered_iot["value"].max() if not filtered_iot.empty else 0
+        max_value = sensor_stats["max"]
         st.markdown(pixel_style_metric("MAXIMUM", f"{max_value:.1f} {unit}", None, color), unsafe_allow_html=True)
     
     # Anomaly detection section with pixel art style
     st.markdown("<h3>ANOMALY DETECTION</h3>", unsafe_allow_html=True)
     
-    # Define anomalies (values that are significantly higher or lower than average)
-    std_dev = filtered_iot["value"].std()
-    mean_val = filtered_iot["value"].mean()
-    threshold = 2  # Number of standard deviations to consider as anomaly
-    
-    anomalies = filtered_iot[
-        (filtered_iot["value"] > mean_val + threshold * std_dev) | 
-        (filtered_iot["value"] < mean_val - threshold * std_dev)
-    ]
+    # Readings flagged by the online detectors (Welford, EWMA, seasonal, MAD), newest first
+    anomalies = feed.engine.anomalies((sensor_type, location), start_date, end_date)
     
     if not anomalies.empty:
         # Create a table with retro gaming styling
@@ -969,8 +1138,8 @@ def create_iot_dashboard(iot_df):
             date_str = row["date"].strftime("%Y-%m-%d")
             time_str = row["date"].strftime("%H:%M")
             value = row["value"]
-            deviation = (value - mean_val) / std_dev
-            deviation_str = f"{deviation:.2f}σ"
+            deviation = row["z"]
+            deviation_str = f"{deviation:.2f}σ {row['detector'].upper()}"
             
             # Determine row color based on deviation
             if deviation > 0:
@@ -1156,38 +1325,43 @@ def create_tenant_insights(tenants_df):
     # Overview metrics in game-style cards
     col1, col2, col3, col4 = st.columns(4)
     
+    # Tenants with an active lease today against those active a period earlier
+    tenant_metrics, tenant_deltas = query_kpis(
+        "tenants", (), query_fingerprint("tenants"), pd.Timestamp(datetime.now().date()), tenants_df
+    )
+    
     with col1:
         st.markdown(pixel_style_metric(
-            "TOTAL TENANTS", 
-            str(len(tenants_df)), 
-            5, 
+            "ACTIVE TENANTS", 
+            str(tenant_metrics["tenants"]), 
+            tenant_deltas["tenants"], 
             "#FF6B6B"
         ), unsafe_allow_html=True)
     
     with col2:
-        avg_satisfaction = round(tenants_df["satisfaction_score"].mean())
+        avg_satisfaction = round(tenant_metrics["satisfaction"])
         st.markdown(pixel_style_metric(
             "AVG SATISFACTION", 
             f"{avg_satisfaction}/100", 
-            3, 
+            tenant_deltas["satisfaction"], 
             "#4ECDC4"
         ), unsafe_allow_html=True)
     
     with col3:
-        retention_rate = round(tenants_df["retention_probability"].mean() * 100)
+        retention_rate = round(tenant_metrics["retention"] * 100)
         st.markdown(pixel_style_metric(
             "RETENTION RATE", 
             f"{retention_rate}%", 
-            -2, 
+            tenant_deltas["retention"], 
             "#FFE66D"
         ), unsafe_allow_html=True)
     
     with col4:
-        total_revenue = sum(tenants_df["monthly_rent"]) / 1000
+        total_revenue = tenant_metrics["monthly_rent"] / 1000
         st.markdown(pixel_style_metric(
             "MONTHLY REVENUE", 
             f"${total_revenue:.0f}K", 
-            8, 
+            tenant_deltas["monthly_rent"], 
             "#9D65C9"
         ), unsafe_allow_html=True)
         
@@ -1214,13 +1388,10 @@ def create_tenant_insights(tenants_df):
     
     # Update layout for retro gaming aesthetic
     fig.update_layout(
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=20, color="white"),
+        title_font=dict(size=20),
         showlegend=False,
-        xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=14)),
-        yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=14))
+        xaxis=dict(tickfont=dict(size=14)),
+        yaxis=dict(tickfont=dict(size=14))
     )
     
     # Make bars look more pixel-like
@@ -1229,24 +1400,20 @@ def create_tenant_insights(tenants_df):
         hovertemplate="<b>%{x}</b><br>Tenants: %{y}<extra></extra>"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Tenant lease timeline
     st.markdown("<h3>LEASE TIMELINE RADAR</h3>", unsafe_allow_html=True)
     
-    # Calculate months until lease expiration
-    current_date = datetime.now().date()
-    tenants_df["months_to_expiration"] = tenants_df.apply(
-        lambda row: (row["lease_end"].date() - current_date).days / 30,
-        axis=1
-    )
-    
     # Create columns for the lease timeline and tenant satisfaction
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Filter to just show next 12 months of expirations
-        next_year_expirations = tenants_df[tenants_df["months_to_expiration"] <= 12].sort_values("months_to_expiration")
+        # Filter to just show the soonest expirations in the next 12 months
+        # (months_to_expiration is precomputed when the dataset is generated)
+        next_year_expirations = tenants_df[tenants_df["months_to_expiration"] <= 12].nsmallest(
+            LEASE_TIMELINE_MAX_TENANTS, "months_to_expiration"
+        )
         
         if not next_year_expirations.empty:
             # Create a timeline-like visualization
@@ -1295,15 +1462,11 @@ def create_tenant_insights(tenants_df):
             # Update layout for retro gaming aesthetic
             fig.update_layout(
                 title="UPCOMING LEASE EXPIRATIONS",
-                plot_bgcolor="#2A2A72",
-                paper_bgcolor="#2A2A72",
-                font=dict(family="VT323", size=14, color="white"),
-                title_font=dict(family="VT323", size=20, color="white"),
+                title_font=dict(size=20),
                 xaxis=dict(
                     title="MONTHS UNTIL EXPIRATION",
                     range=[-3, 13],
-                    gridcolor="#556270",
-                    tickfont=dict(family="VT323", size=12)
+                    tickfont=dict(size=12)
                 ),
                 yaxis=dict(
                     showticklabels=False,
@@ -1324,7 +1487,7 @@ def create_tenant_insights(tenants_df):
                     line=dict(color="#556270", width=1, dash="dot")
                 )
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, theme=None)
         else:
             st.markdown("""
             <div style="
@@ -1353,12 +1516,9 @@ def create_tenant_insights(tenants_df):
         
         # Update layout for retro gaming aesthetic
         fig.update_layout(
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=16, color="white"),
-            xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=12)),
-            yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=12), title="COUNT")
+            title_font=dict(size=16),
+            xaxis=dict(tickfont=dict(size=12)),
+            yaxis=dict(tickfont=dict(size=12), title="COUNT")
         )
         
         # Make bars look more pixel-like
@@ -1369,7 +1529,7 @@ def create_tenant_insights(tenants_df):
             )
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Tenant retention analysis
     st.markdown("<h3>TENANT RETENTION ANALYSIS</h3>", unsafe_allow_html=True)
@@ -1401,21 +1561,15 @@ def create_tenant_insights(tenants_df):
     
     # Update layout for retro gaming aesthetic
     fig.update_layout(
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=20, color="white"),
-        legend_title_font=dict(family="VT323", size=14),
-        legend_font=dict(family="VT323", size=12),
+        title_font=dict(size=20),
+        legend_title_font=dict(size=14),
         xaxis=dict(
-            gridcolor="#556270", 
-            tickfont=dict(family="VT323", size=14),
+            tickfont=dict(size=14),
             range=[55, 105]
         ),
         yaxis=dict(
-            gridcolor="#556270", 
-            tickfont=dict(family="VT323", size=14),
-            range=[0.55, 1.0],
+            tickfont=dict(size=14),
+            range=[0, 1],
             tickformat=".0%"
         )
     )
@@ -1428,33 +1582,33 @@ def create_tenant_insights(tenants_df):
         )
     )
     
-    # Add a reference box for high-value at-risk tenants
+    # Shade the tenants the model flags as at risk, across every satisfaction score
     fig.add_shape(
         type="rect",
         x0=55,
-        y0=0.55,
-        x1=75,
-        y1=0.7,
+        y0=0,
+        x1=105,
+        y1=AT_RISK_RETENTION,
         line=dict(color="#FF6B6B", width=2, dash="dash"),
         fillcolor="rgba(255, 107, 107, 0.1)"
     )
     
     # Add annotation for the reference box
     fig.add_annotation(
-        x=65,
-        y=0.625,
+        x=80,
+        y=AT_RISK_RETENTION / 2,
         text="AT-RISK TENANTS",
         showarrow=False,
         font=dict(family="VT323", size=14, color="#FF6B6B")
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Top tenants by revenue
     st.markdown("<h3>TOP TENANTS LEADERBOARD</h3>", unsafe_allow_html=True)
     
     # Sort tenants by monthly rent
-    top_tenants = tenants_df.sort_values("monthly_rent", ascending=False).head(5)
+    top_tenants = tenants_df.nlargest(5, "monthly_rent")
     
     # Create a pixel-style table
     st.markdown("""
@@ -1541,78 +1695,73 @@ def create_predictive_dashboard():
         with col1:
             growth_rate = st.slider(
                 "MARKET GROWTH RATE",
-                min_value=-5.0,
-                max_value=10.0,
+                min_value=GROWTH_RANGE[0],
+                max_value=GROWTH_RANGE[1],
                 value=3.0,
-                step=0.5,
+                step=GROWTH_RANGE[2],
                 format="%f%%"
             )
         
         with col2:
             occupancy_change = st.slider(
                 "OCCUPANCY CHANGE",
-                min_value=-10.0,
-                max_value=10.0,
+                min_value=OCCUPANCY_RANGE[0],
+                max_value=OCCUPANCY_RANGE[1],
                 value=2.0,
-                step=1.0,
+                step=OCCUPANCY_RANGE[2],
                 format="%f%%"
             )
         
         with col3:
             pricing_strategy = st.selectbox(
                 "PRICING STRATEGY",
-                options=["Conservative", "Balanced", "Aggressive"]
+                options=list(STRATEGY_FACTORS)
             )
         
-        # Create simulated forecast data
-        months = list(range(1, 13))
-        base_revenue = 500000  # Starting monthly revenue
-        
-        # Adjust growth based on pricing strategy
-        if pricing_strategy == "Conservative":
-            strategy_factor = 0.8
-            color = "#4ECDC4"
-        elif pricing_strategy == "Balanced":
-            strategy_factor = 1.0
-            color = "#FFE66D"
-        else:  # Aggressive
-            strategy_factor = 1.2
-            color = "#FF6B6B"
-        
-        # Generate forecast with some seasonal variation
-        forecast = []
-        for month in months:
-            # Base growth
-            monthly_growth = (1 + (growth_rate / 100)) ** (month / 12)
-            
-            # Occupancy effect
-            occupancy_effect = (1 + (occupancy_change / 100)) ** (month / 12)
-            
-            # Seasonal variation (Q4 boost for retail properties)
-            seasonal_factor = 1.0
-            if month >= 9:  # Q4 months
-                seasonal_factor = 1.1
-            
-            # Combined factors
-            monthly_revenue = base_revenue * monthly_growth * occupancy_effect * seasonal_factor * strategy_factor
-            
-            # Add some randomness
-            noise_factor = 1 + random.uniform(-0.02, 0.02)
-            monthly_revenue *= noise_factor
-            
-            forecast.append(monthly_revenue)
-        
-        # Create a pixel-style line chart
+        horizon_col, sweep_col = st.columns([3, 1])
+        with horizon_col:
+            horizon = st.select_slider("FORECAST HORIZON (MONTHS)", options=FORECAST_HORIZONS, value=12)
+        with sweep_col:
+            sweep_mode = st.checkbox("⚡ SWEEP MODE", value=False, help="Look scenarios up in a precomputed grid of every slider combination")
+        
+        if sweep_mode:
+            # Expected (noise-free) forecast straight from the cached scenario grid
+            sweep = load_revenue_sweep()
+            expected = sweep.forecast(growth_rate, occupancy_change, pricing_strategy)[:horizon]
+            bands = pd.DataFrame({"month": np.arange(1, horizon + 1), "p50": expected})
+            annual = {"p50": expected[:12].sum()}
+        else:
+            # Every press of RUN SIMULATION AGAIN draws a fresh set of paths
+            simulation_run = st.session_state.get("simulation_run", 0)
+            bands, annual = simulate_revenue_forecast(growth_rate, occupancy_change, pricing_strategy, horizon, simulation_run)
+        base_revenue = BASE_MONTHLY_REVENUE
+        color = STRATEGY_COLORS[pricing_strategy]
+        months = bands["month"].tolist()
+        forecast = bands["p50"].tolist()
+        
+        # Create a pixel-style line chart: P10-P90 band around the median path
         fig = go.Figure()
         
+        if "p10" in bands:
+            fig.add_trace(go.Scatter(
+                x=months + months[::-1],
+                y=bands["p90"].tolist() + bands["p10"].tolist()[::-1],
+                fill="toself",
+                fillcolor=color,
+                opacity=0.25,
+                line=dict(width=0),
+                hoverinfo="skip",
+                name="P10-P90"
+            ))
+        
         # Add forecast line
         fig.add_trace(go.Scatter(
             x=months,
             y=forecast,
             mode="lines+markers",
             line=dict(color=color, width=3),
-            marker=dict(size=8, symbol="square"),
-            name="Forecast"
+            marker=dict(size=8 if horizon <= 24 else 4, symbol="square"),
+            name="Expected" if sweep_mode else "Forecast (P50)"
         ))
         
         # Add baseline (no growth) line
@@ -1625,37 +1774,29 @@ def create_predictive_dashboard():
             name="Baseline"
         ))
         
-        # Calculate annual growth
-        annual_growth = forecast[-1] / base_revenue - 1
-        total_annual_revenue = sum(forecast)
+        # Calculate annual growth from the median path
+        annual_growth = forecast[11] / base_revenue - 1
+        total_annual_revenue = annual["p50"]
         
         # Update layout for retro gaming aesthetic
         fig.update_layout(
-            title="12-MONTH REVENUE FORECAST",
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=24, color="white"),
-            legend_title_font=dict(family="VT323"),
-            legend_font=dict(family="VT323", size=12),
+            title=f"{horizon}-MONTH REVENUE FORECAST ({'SCENARIO GRID' if sweep_mode else f'{FORECAST_PATHS:,} SIMULATIONS'})",
             xaxis=dict(
                 title="MONTH",
-                gridcolor="#556270",
-                tickfont=dict(family="VT323", size=14),
-                tickvals=months
+                tickfont=dict(size=14),
+                tickvals=months if horizon <= 24 else months[11::12]
             ),
             yaxis=dict(
                 title="MONTHLY REVENUE ($)",
-                gridcolor="#556270",
-                tickfont=dict(family="VT323", size=14),
+                tickfont=dict(size=14),
                 tickformat="$,.0f"
             )
         )
         
         # Add annotation for annual growth
         fig.add_annotation(
-            x=months[-1],
-            y=forecast[-1],
+            x=months[11],
+            y=forecast[11],
             text=f"Annual Growth: {annual_growth*100:.1f}%",
             showarrow=True,
             arrowhead=1,
@@ -1665,20 +1806,38 @@ def create_predictive_dashboard():
             borderwidth=2
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
         
         # Display key metrics from the simulation
-        metric_cols = st.columns(3)
+        metric_cols = st.columns(4)
         
         with metric_cols[0]:
             st.markdown(pixel_style_metric(
                 "ANNUAL REVENUE", 
                 f"${total_annual_revenue/1000000:.2f}M", 
-                annual_growth*100, 
+                round(annual_growth*100, 1), 
                 color
             ), unsafe_allow_html=True)
         
         with metric_cols[1]:
+            if sweep_mode:
+                # Where this scenario sits among every growth x occupancy combination of the strategy
+                grid_annual = sweep.annual_grid(pricing_strategy).to_numpy()
+                st.markdown(pixel_style_metric(
+                    "GRID PERCENTILE", 
+                    f"P{round(100 * (grid_annual < annual['p50']).mean())}", 
+                    None, 
+                    color
+                ), unsafe_allow_html=True)
+            else:
+                st.markdown(pixel_style_metric(
+                    "P10-P90 ANNUAL", 
+                    f"${annual['p10']/1000000:.2f}-{annual['p90']/1000000:.2f}M", 
+                    None, 
+                    color
+                ), unsafe_allow_html=True)
+        
+        with metric_cols[2]:
             avg_monthly = sum(forecast) / len(forecast)
             st.markdown(pixel_style_metric(
                 "AVG MONTHLY", 
@@ -1687,7 +1846,7 @@ def create_predictive_dashboard():
                 color
             ), unsafe_allow_html=True)
         
-        with metric_cols[2]:
+        with metric_cols[3]:
             peak_month = months[forecast.index(max(forecast))]
             st.markdown(pixel_style_metric(
                 "PEAK MONTH", 
@@ -1696,12 +1855,112 @@ def create_predictive_dashboard():
                 color
             ), unsafe_allow_html=True)
         
+        if sweep_mode:
+            # First-year revenue of every scenario of the strategy, current sliders marked
+            grid = sweep.annual_grid(pricing_strategy)
+            fig = go.Figure(go.Heatmap(
+                z=grid.to_numpy() / 1000000,
+                x=grid.columns,
+                y=grid.index,
+                colorscale=[[0, "#FF6B6B"], [0.5, "#FFE66D"], [1, "#4ECDC4"]],
+                colorbar=dict(title="$M"),
+                hovertemplate="Growth %{y}%<br>Occupancy %{x}%<br>$%{z:.2f}M<extra></extra>"
+            ))
+            fig.add_trace(go.Scatter(
+                x=[occupancy_change],
+                y=[growth_rate],
+                mode="markers",
+                marker=dict(size=14, symbol="square-open", color="white", line=dict(width=3)),
+                name="Current",
+                showlegend=False
+            ))
+            fig.update_layout(
+                title=f"12-MONTH REVENUE ACROSS ALL SCENARIOS ({pricing_strategy.upper()})",
+                xaxis=dict(title="OCCUPANCY CHANGE (%)"),
+                yaxis=dict(title="MARKET GROWTH RATE (%)")
+            )
+            st.plotly_chart(fig, use_container_width=True, theme=None)
+        
         # Game-like action buttons
         col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
         with col2:
-            st.button("🎮 RUN SIMULATION AGAIN", key="run_simulation")
+            if st.button("🎮 RUN SIMULATION AGAIN", key="run_simulation", disabled=sweep_mode):
+                st.session_state["simulation_run"] = simulation_run + 1
+                st.rerun()
         with col3:
             st.button("💾 SAVE FORECAST", key="save_forecast")
+        
+        # Portfolio run: every property under every pricing strategy, sharded across cores
+        st.markdown("<h3>PORTFOLIO SIMULATION</h3>", unsafe_allow_html=True)
+        
+        properties = load_property_data(columns=("name", "size_sqft", "revenue_per_sqft"))
+        run_key = (growth_rate, occupancy_change, horizon, len(properties))
+        portfolio_runs = st.session_state.get("portfolio_runs", {})
+        
+        if st.button(f"🚀 RUN PORTFOLIO SIMULATION ({len(properties):,} PROPERTIES x {len(STRATEGY_FACTORS)} STRATEGIES)", key="run_portfolio"):
+            monthly_revenue = properties["revenue_per_sqft"].to_numpy(dtype=np.float64) * properties["size_sqft"].to_numpy() / 12
+            scenarios = [(growth_rate, occupancy_change, factor) for factor in STRATEGY_FACTORS.values()]
+            progress_bar = st.progress(0.0, text="SPAWNING WORKERS...")
+            # Changing any input reruns the page, which raises inside the progress update
+            # and cancels the shards that have not started yet without waiting on the rest
+            annual, portfolio_bands = load_scenario_runner().run(
+                monthly_revenue, scenarios, horizon, seed=DATA_SEED,
+                progress=lambda done, total: progress_bar.progress(done / total, text=f"SHARD {done}/{total}")
+            )
+            progress_bar.empty()
+            portfolio_runs = {run_key: (annual, portfolio_bands)}
+            st.session_state["portfolio_runs"] = portfolio_runs
+        
+        if run_key in portfolio_runs:
+            annual, portfolio_bands = portfolio_runs[run_key]
+            fig = go.Figure()
+            for strategy, strategy_bands in zip(STRATEGY_FACTORS, portfolio_bands):
+                months = strategy_bands["month"].tolist()
+                fig.add_trace(go.Scatter(
+                    x=months + months[::-1],
+                    y=strategy_bands["p90"].tolist() + strategy_bands["p10"].tolist()[::-1],
+                    fill="toself",
+                    fillcolor=STRATEGY_COLORS[strategy],
+                    opacity=0.2,
+                    line=dict(width=0),
+                    hoverinfo="skip",
+                    showlegend=False
+                ))
+                fig.add_trace(go.Scatter(
+                    x=months,
+                    y=strategy_bands["p50"],
+                    mode="lines",
+                    line=dict(color=STRATEGY_COLORS[strategy], width=3),
+                    name=strategy
+                ))
+            fig.update_layout(
+                title="PORTFOLIO MONTHLY REVENUE BY STRATEGY (P10-P90)",
+                xaxis=dict(title="MONTH"),
+                yaxis=dict(title="MONTHLY REVENUE ($)", tickformat="$,.0f")
+            )
+            st.plotly_chart(fig, use_container_width=True, theme=None)
+            
+            # Properties with the highest median first-year revenue under the chosen strategy
+            strategy_annual = annual[list(STRATEGY_FACTORS).index(pricing_strategy)]
+            top = np.argsort(-strategy_annual[:, 1], kind="stable")[:10]
+            cell = 'style="padding: 8px; border: 2px solid white; text-align: center;"'
+            rows = "".join(
+                f"<tr><td {cell}>{rank}</td><td {cell}>{properties['name'].iloc[i]}</td>"
+                f"<td {cell}>${strategy_annual[i, 0]:,.0f}</td><td {cell}>${strategy_annual[i, 1]:,.0f}</td>"
+                f"<td {cell}>${strategy_annual[i, 2]:,.0f}</td></tr>"
+                for rank, i in enumerate(top, 1)
+            )
+            st.markdown(f"""
+            <div style="background-color: #2A2A72; border: 3px solid white; box-shadow: 4px 4px 0px black; padding: 15px; color: white;">
+                <h4 style="text-align: center; color: {color}; margin-top: 0;">TOP PROPERTIES - {pricing_strategy.upper()} FIRST-YEAR REVENUE</h4>
+                <table style="width: 100%; border-collapse: collapse;">
+                    <tr style="background-color: #556270;">
+                        <th {cell}>RANK</th><th {cell}>PROPERTY</th><th {cell}>P10</th><th {cell}>P50</th><th {cell}>P90</th>
+                    </tr>
+                    {rows}
+                </table>
+            </div>
+            """, unsafe_allow_html=True)
     
     elif model_selection == "Occupancy Prediction":
         # Occupancy prediction section
@@ -1731,7 +1990,7 @@ def create_predictive_dashboard():
         with col2:
             property_improvements = st.multiselect(
                 "PROPERTY IMPROVEMENTS",
-                options=["Smart Building Features", "Renovated Common Areas", "Improved Amenities", "Sustainable Features", "Enhanced Security"],
+                options=IMPROVEMENT_OPTIONS,
                 default=["Smart Building Features"]
             )
             
@@ -1744,23 +2003,17 @@ def create_predictive_dashboard():
             )
         
         # Calculate predicted occupancy based on inputs
-        base_occupancy = 0.75  # Starting point
-        
-        # Market demand effect (0.5 to 1.0 multiplier)
-        market_factor = 0.5 + (market_demand / 20)
+        base_occupancy = BASE_OCCUPANCY  # Starting point
         
-        # Rental adjustment effect (inverse relationship)
-        rental_factor = 1.0 - (rental_adjustment / 100)
-        
-        # Property improvements effect (each adds 2%)
-        improvement_factor = 1.0 + (len(property_improvements) * 0.02)
-        
-        # Marketing investment effect (0.9 to 1.1 multiplier)
-        marketing_factor = 0.9 + (marketing_investment / 50)
+        # Market demand (0.5 to 1.0), rental adjustment (inverse), improvements (+2% each)
+        # and marketing (0.9 to 1.1) multipliers
+        market_factor, rental_factor, improvement_factor, marketing_factor = (
+            float(factor) for factor in occupancy_factors(market_demand, rental_adjustment, len(property_improvements), marketing_investment)
+        )
         
-        # Combined effect with limits
-        predicted_occupancy = base_occupancy * market_factor * rental_factor * improvement_factor * marketing_factor
-        predicted_occupancy = max(0.5, min(0.98, predicted_occupancy))  # Cap between 50% and 98%
+        # Every input combination is precomputed; the prediction is a lookup, capped between 50% and 98%
+        surface = load_occupancy_surface(base_occupancy)
+        predicted_occupancy = surface.predict(market_demand, rental_adjustment, property_improvements, marketing_investment)
         
         # Create a gauge chart for predicted occupancy
         fig = go.Figure(go.Indicator(
@@ -1775,9 +2028,9 @@ def create_predictive_dashboard():
                 "borderwidth": 2,
                 "bordercolor": "white",
                 "steps": [
-                    {"range": [0, 65], "color": "#FF6B6B30"},
-                    {"range": [65, 80], "color": "#FFE66D30"},
-                    {"range": [80, 100], "color": "#4ECDC430"}
+                    {"range": [0, 65], "color": "rgba(255, 107, 107, 0.19)"},
+                    {"range": [65, 80], "color": "rgba(255, 230, 109, 0.19)"},
+                    {"range": [80, 100], "color": "rgba(78, 205, 196, 0.19)"}
                 ],
                 "threshold": {
                     "line": {"color": "white", "width": 4},
@@ -1791,12 +2044,10 @@ def create_predictive_dashboard():
         # Update layout for retro gaming aesthetic
         fig.update_layout(
             height=300,
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
             margin=dict(l=50, r=50, t=80, b=50)
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
         
         # Add impact factors breakdown
         st.markdown("<h3>IMPACT FACTORS</h3>", unsafe_allow_html=True)
@@ -1839,6 +2090,62 @@ def create_predictive_dashboard():
                 "#4ECDC4" if marketing_impact > 0 else "#FF6B6B"
             ), unsafe_allow_html=True)
         
+        # Sensitivity: how far each input (and each single improvement) can move the prediction
+        st.markdown("<h3>SENSITIVITY ANALYSIS</h3>", unsafe_allow_html=True)
+        
+        tornado = surface.tornado(market_demand, rental_adjustment, property_improvements, marketing_investment)[::-1]
+        labels = [OCCUPANCY_INPUT_LABELS.get(name, name.upper()) for name in tornado["input"]]
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            y=labels,
+            x=(tornado["low"] - predicted_occupancy) * 100,
+            base=predicted_occupancy * 100,
+            orientation="h",
+            marker=dict(color="#FF6B6B", line=dict(color="black", width=2)),
+            name="Downside"
+        ))
+        fig.add_trace(go.Bar(
+            y=labels,
+            x=(tornado["high"] - predicted_occupancy) * 100,
+            base=predicted_occupancy * 100,
+            orientation="h",
+            marker=dict(color="#4ECDC4", line=dict(color="black", width=2)),
+            name="Upside"
+        ))
+        fig.add_vline(x=predicted_occupancy * 100, line=dict(color="white", width=2, dash="dot"))
+        fig.update_layout(
+            title="OCCUPANCY SWING PER INPUT",
+            barmode="overlay",
+            xaxis=dict(title="PREDICTED OCCUPANCY (%)"),
+            height=380,
+            margin=dict(l=50, r=50, t=80, b=50)
+        )
+        st.plotly_chart(fig, use_container_width=True, theme=None)
+        
+        # Partial dependence: mean prediction over every other input combination
+        fig = make_subplots(rows=1, cols=len(OCCUPANCY_INPUTS), shared_yaxes=True,
+                            subplot_titles=[OCCUPANCY_INPUT_LABELS[name] for name in OCCUPANCY_INPUTS])
+        current = {
+            "market_demand": market_demand,
+            "rental_adjustment": rental_adjustment,
+            "improvements": len(property_improvements),
+            "marketing_investment": marketing_investment
+        }
+        for col, name in enumerate(OCCUPANCY_INPUTS, 1):
+            curve = surface.partial_dependence(name)
+            fig.add_trace(go.Scatter(
+                x=curve.index,
+                y=curve.to_numpy() * 100,
+                mode="lines+markers",
+                line=dict(color="#FFE66D", width=3),
+                marker=dict(size=6, symbol="square"),
+                showlegend=False
+            ), row=1, col=col)
+            fig.add_vline(x=current[name], line=dict(color="white", width=1, dash="dot"), row=1, col=col)
+        fig.update_layout(title="PARTIAL DEPENDENCE", height=300, margin=dict(l=50, r=50, t=80, b=50))
+        fig.update_yaxes(title_text="MEAN OCCUPANCY (%)", row=1, col=1)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
+        
         # Recommendations based on prediction
         st.markdown("<h3>AI RECOMMENDATIONS</h3>", unsafe_allow_html=True)
         
@@ -1918,21 +2225,121 @@ def create_predictive_dashboard():
             # Update layout for retro gaming aesthetic
             fig.update_layout(
                 title="MARKET OCCUPANCY BY PROPERTY TYPE",
-                plot_bgcolor="#2A2A72",
-                paper_bgcolor="#2A2A72",
-                font=dict(family="VT323", size=14, color="white"),
-                title_font=dict(family="VT323", size=18, color="white"),
-                xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=14)),
+                title_font=dict(size=18),
+                xaxis=dict(tickfont=dict(size=14)),
                 yaxis=dict(
-                    gridcolor="#556270", 
-                    tickfont=dict(family="VT323", size=14),
+                    tickfont=dict(size=14),
                     tickformat=".0%",
                     range=[0, 1]
                 ),
                 margin=dict(l=50, r=50, t=80, b=50)
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, theme=None)
+    
+    elif model_selection == "Tenant Retention":
+        # Tenant retention section
+        st.markdown("<h3>TENANT RETENTION RADAR</h3>", unsafe_allow_html=True)
+        
+        # Logistic model trained once and persisted; every tenant page shows its scores
+        model = load_retention_model()
+        tenants_df = load_scored_tenant_data()
+        retention = tenants_df["retention_probability"].to_numpy(dtype=np.float64)
+        at_risk = retention < AT_RISK_RETENTION
+        
+        metric_cols = st.columns(4)
+        
+        with metric_cols[0]:
+            st.markdown(pixel_style_metric(
+                "PREDICTED RETENTION", 
+                f"{retention.mean()*100:.0f}%", 
+                None, 
+                "#4ECDC4"
+            ), unsafe_allow_html=True)
+        
+        with metric_cols[1]:
+            st.markdown(pixel_style_metric(
+                "AT-RISK TENANTS", 
+                f"{at_risk.sum():,}", 
+                None, 
+                "#FF6B6B"
+            ), unsafe_allow_html=True)
+        
+        with metric_cols[2]:
+            st.markdown(pixel_style_metric(
+                "MODEL AUC", 
+                f"{model.metrics['auc']:.2f}", 
+                None, 
+                "#FFE66D"
+            ), unsafe_allow_html=True)
+        
+        with metric_cols[3]:
+            st.markdown(pixel_style_metric(
+                "MODEL ACCURACY", 
+                f"{model.metrics['accuracy']*100:.0f}%", 
+                None, 
+                "#9D65C9"
+            ), unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Standardized coefficients: change in log-odds per standard deviation of each feature
+            drivers = model.drivers()
+            fig = go.Figure(go.Bar(
+                x=list(drivers.values())[::-1],
+                y=[RETENTION_FEATURE_LABELS[feature] for feature in drivers][::-1],
+                orientation="h",
+                marker_color=["#4ECDC4" if weight > 0 else "#FF6B6B" for weight in list(drivers.values())[::-1]],
+                marker_line_color="black",
+                marker_line_width=2
+            ))
+            fig.update_layout(
+                title="RETENTION DRIVERS",
+                xaxis=dict(title="LOG-ODDS PER STD DEV"),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, theme=None)
+        
+        with col2:
+            fig = go.Figure(go.Histogram(
+                x=retention * 100,
+                xbins=dict(start=0, end=100, size=5),
+                marker_color="#FFE66D",
+                marker_line_color="black",
+                marker_line_width=2
+            ))
+            fig.add_vline(x=AT_RISK_RETENTION * 100, line=dict(color="#FF6B6B", width=3, dash="dot"))
+            fig.update_layout(
+                title="PREDICTED RETENTION DISTRIBUTION",
+                xaxis=dict(title="RETENTION PROBABILITY (%)"),
+                yaxis=dict(title="TENANTS"),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, theme=None)
+        
+        # Lowest predicted retention first
+        riskiest = np.argsort(retention, kind="stable")[:10]
+        cell = 'style="padding: 8px; border: 2px solid white; text-align: center;"'
+        rows = "".join(
+            f"<tr style=\"background-color: {'#FF6B6B' if retention[i] < AT_RISK_RETENTION else '#556270'}40;\">"
+            f"<td {cell}>{tenants_df['name'].iloc[i]}</td><td {cell}>{tenants_df['business_type'].iloc[i]}</td>"
+            f"<td {cell}>{tenants_df['satisfaction_score'].iloc[i]}/100</td><td {cell}>{tenants_df['service_requests_monthly'].iloc[i]}</td>"
+            f"<td {cell}>{tenants_df['months_to_expiration'].iloc[i]:.0f}</td><td {cell}>{retention[i]*100:.0f}%</td></tr>"
+            for i in riskiest
+        )
+        st.markdown(f"""
+        <div style="background-color: #2A2A72; border: 3px solid white; box-shadow: 4px 4px 0px black; padding: 15px; color: white;">
+            <h4 style="text-align: center; color: #FF6B6B; margin-top: 0;">TENANTS MOST LIKELY TO LEAVE</h4>
+            <table style="width: 100%; border-collapse: collapse;">
+                <tr style="background-color: #556270;">
+                    <th {cell}>TENANT</th><th {cell}>BUSINESS TYPE</th><th {cell}>SATISFACTION</th>
+                    <th {cell}>REQUESTS / MONTH</th><th {cell}>MONTHS LEFT</th><th {cell}>RETENTION</th>
+                </tr>
+                {rows}
+            </table>
+        </div>
+        """, unsafe_allow_html=True)
 
 def main():
     """Main function to run the Streamlit app"""
@@ -1940,24 +2347,33 @@ def main():
     create_pixel_art_header()
     
     # Create the game-like menu
-    menu_selection, date_range, selected_properties = create_game_menu()
+    menu_selection, date_range, selected_properties, live_feed = create_game_menu()
     
-    # Generate sample data
-    properties_df = generate_sample_property_data(15)
-    iot_df = generate_iot_sensor_data(30, 5)
-    tenants_df = generate_tenant_data(25)
+    # Apply the sidebar filters through the cached query layer
+    start_date, end_date, property_filter = normalize_filters(date_range, selected_properties)
     
-    # Display the selected page
+    # Display the selected page, loading only the datasets it needs
     if menu_selection == "🏢 Executive Dashboard":
-        create_executive_dashboard(properties_df, iot_df, tenants_df)
+        create_executive_dashboard(
+            query_property_data(property_filter),
+            load_scored_tenant_data(),
+            poll_iot_feed(live_feed),
+            load_portfolio(property_filter),
+            property_filter
+        )
     elif menu_selection == "🔍 Property Analytics":
-        create_property_analytics(properties_df)
+        create_property_analytics(query_property_data(property_filter), load_portfolio(property_filter))
     elif menu_selection == "🤖 IoT Systems":
-        create_iot_dashboard(iot_df)
+        create_iot_dashboard(poll_iot_feed(live_feed), start_date, end_date)
     elif menu_selection == "👥 Tenant Insights":
-        create_tenant_insights(tenants_df)
+        create_tenant_insights(load_scored_tenant_data())
     elif menu_selection == "📊 Predictive Models":
         create_predictive_dashboard()
+    
+    # Keep pulling readings while the live feed is on
+    if live_feed and menu_selection in LIVE_PAGES:
+        time.sleep(IOT_REFRESH_SECONDS)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,18 +1,33 @@
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+RETRO_TEMPLATE = "retro"
+
+# Shared retro gaming layout; registered once as a Plotly template so chart
+# builders only set what differs from it
+RETRO_LAYOUT = dict(
+    plot_bgcolor="#2A2A72",
+    paper_bgcolor="#2A2A72",
+    font=dict(family="VT323", size=14, color="white"),
+    title=dict(font=dict(family="VT323", size=24, color="white")),
+    legend=dict(title=dict(font=dict(family="VT323", size=12)), font=dict(family="VT323", size=12)),
+    xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
+    yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323"))
+)
+
+def register_retro_template(base="plotly"):
+    """Register the retro Plotly template, merged onto base, and make it the default"""
+    if RETRO_TEMPLATE not in pio.templates:
+        # Merge once here rather than composing "base+retro" on every figure
+        template = go.layout.Template(pio.templates[base]) if base else go.layout.Template()
+        template.layout.update(RETRO_LAYOUT)
+        pio.templates[RETRO_TEMPLATE] = template
+    pio.templates.default = RETRO_TEMPLATE
 
 def apply_retro_style_to_figure(fig, title=None):
-    """Apply retro gaming styling to a plotly figure"""
-    fig.update_layout(
-        title=title,
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=24, color="white"),
-        legend_title_font=dict(family="VT323", size=12),
-        legend_font=dict(family="VT323", size=12),
-        xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
-        yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323"))
-    )
+    """Apply retro gaming styling to a plotly figure built outside the default template"""
+    fig.update_layout(title=title, template=pio.templates.default)
     return fig
 
 def create_pixel_gauge(value, title, min_val=0, max_val=100, color="#4ECDC4", suffix=""):
@@ -21,9 +36,9 @@ def create_pixel_gauge(value, title, min_val=0, max_val=100, color="#4ECDC4", su
         mode="gauge+number",
         value=value,
         domain={"x": [0, 1], "y": [0, 1]},
-        title={"text": title, "font": {"family": "VT323", "size": 24}},
+        title={"text": title, "font": {"size": 24}},
         gauge={
-            "axis": {"range": [min_val, max_val], "tickfont": {"family": "VT323"}},
+            "axis": {"range": [min_val, max_val]},
             "bar": {"color": color},
             "bgcolor": "white",
             "borderwidth": 2,
@@ -33,15 +48,59 @@ def create_pixel_gauge(value, title, min_val=0, max_val=100, color="#4ECDC4", su
                 {"range": [min_val + (max_val-min_val)*0.5, value], "color": color}
             ],
         },
-        number={"font": {"family": "VT323", "size": 40}, "suffix": suffix}
+        number={"font": {"size": 40}, "suffix": suffix}
     ))
     
     fig.update_layout(
         height=200,
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font={"family": "VT323", "color": "white"},
         margin=dict(l=30, r=30, t=50, b=30)
     )
     
-    return fig
\ No newline at end of file
+    return fig
+
+def create_pixel_gauge_grid(gauges, columns=5, row_height=200):
+    """Create a single figure holding a grid of retro pixel gauges
+
+    Each gauge is a dict with "value", "title" and optional "color", "suffix",
+    "min" and "max" keys. All gauges share one figure, so the page ships one
+    Plotly payload no matter how many sensors are shown.
+    """
+    columns = max(1, min(columns, len(gauges)))
+    rows = max(1, -(-len(gauges) // columns))
+
+    fig = make_subplots(
+        rows=rows,
+        cols=columns,
+        specs=[[{"type": "indicator"}] * columns for _ in range(rows)]
+    )
+
+    for i, gauge in enumerate(gauges):
+        value = gauge["value"]
+        color = gauge.get("color", "#4ECDC4")
+        min_val = gauge.get("min", 0)
+        max_val = gauge.get("max", value * 1.5)
+
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=value,
+            title={"text": gauge["title"], "font": {"size": 24}},
+            gauge={
+                "axis": {"range": [min_val, max_val]},
+                "bar": {"color": color},
+                "bgcolor": "white",
+                "borderwidth": 2,
+                "bordercolor": "black",
+                "steps": [
+                    {"range": [min_val, value * 0.5], "color": "lightgray"},
+                    {"range": [value * 0.5, value], "color": color}
+                ],
+            },
+            number={"font": {"size": 40}, "suffix": gauge.get("suffix", "")}
+        ), row=i // columns + 1, col=i % columns + 1)
+
+    fig.update_layout(
+        height=row_height * rows,
+        margin=dict(l=30, r=30, t=50, b=30)
+    )
+
+    return fig
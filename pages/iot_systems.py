@@ -88,25 +88,17 @@ def create_dashboard(iot_df):
     # Update layout for retro gaming aesthetic
     fig.update_layout(
         title=f"{sensor_type.upper()} READINGS IN {location}",
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=24, color="white"),
         xaxis=dict(
             title="DATE",
-            gridcolor="#556270",
-            tickfont=dict(family="VT323"),
             tickangle=45
         ),
         yaxis=dict(
-            title=f"{sensor_type.upper()} ({unit})",
-            gridcolor="#556270",
-            tickfont=dict(family="VT323")
+            title=f"{sensor_type.upper()} ({unit})"
         ),
         margin=dict(l=50, r=50, t=80, b=50)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Detailed sensor statistics in pixelated cards
     st.markdown("<h3>SENSOR STATS</h3>", unsafe_allow_html=True)
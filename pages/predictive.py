@@ -114,22 +114,14 @@ def create_dashboard():
         # Update layout for retro gaming aesthetic
         fig.update_layout(
             title="12-MONTH REVENUE FORECAST",
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=24, color="white"),
-            legend_title_font=dict(family="VT323"),
-            legend_font=dict(family="VT323", size=12),
             xaxis=dict(
                 title="MONTH",
-                gridcolor="#556270",
-                tickfont=dict(family="VT323", size=14),
+                tickfont=dict(size=14),
                 tickvals=months
             ),
             yaxis=dict(
                 title="MONTHLY REVENUE ($)",
-                gridcolor="#556270",
-                tickfont=dict(family="VT323", size=14),
+                tickfont=dict(size=14),
                 tickformat="$,.0f"
             )
         )
@@ -147,7 +139,7 @@ def create_dashboard():
             borderwidth=2
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
         
         # Display key metrics from the simulation
         metric_cols = st.columns(3)
@@ -173,17 +173,10 @@ def create_dashboard(properties_df):
         fig.update_layout(
             title="MONTHLY PERFORMANCE (IN $K)",
             barmode="group",
-            plot_bgcolor="#2A2A72",
-            paper_bgcolor="#2A2A72",
-            font=dict(family="VT323", size=14, color="white"),
-            title_font=dict(family="VT323", size=20, color="white"),
-            legend_title_font=dict(family="VT323"),
-            legend_font=dict(family="VT323", size=12),
-            xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
-            yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
+            title_font=dict(size=20),
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Recommendations section styled as power-ups
     st.markdown("<h3>PROPERTY POWER-UPS AVAILABLE</h3>", unsafe_allow_html=True)
@@ -69,13 +69,10 @@ def create_dashboard(tenants_df):
     
     # Update layout for retro gaming aesthetic
     fig.update_layout(
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=20, color="white"),
+        title_font=dict(size=20),
         showlegend=False,
-        xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=14)),
-        yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323", size=14))
+        xaxis=dict(tickfont=dict(size=14)),
+        yaxis=dict(tickfont=dict(size=14))
     )
     
     # Make bars look more pixel-like
@@ -84,7 +81,7 @@ def create_dashboard(tenants_df):
         hovertemplate="<b>%{x}</b><br>Tenants: %{y}<extra></extra>"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, theme=None)
     
     # Tenant lease timeline
     st.markdown("<h3>LEASE TIMELINE RADAR</h3>", unsafe_allow_html=True)
@@ -150,15 +147,11 @@ def create_dashboard(tenants_df):
             # Update layout for retro gaming aesthetic
             fig.update_layout(
                 title="UPCOMING LEASE EXPIRATIONS",
-                plot_bgcolor="#2A2A72",
-                paper_bgcolor="#2A2A72",
-                font=dict(family="VT323", size=14, color="white"),
-                title_font=dict(family="VT323", size=20, color="white"),
+                title_font=dict(size=20),
                 xaxis=dict(
                     title="MONTHS UNTIL EXPIRATION",
                     range=[-3, 13],
-                    gridcolor="#556270",
-                    tickfont=dict(family="VT323", size=12)
+                    tickfont=dict(size=12)
                 ),
                 yaxis=dict(
                     showticklabels=False,
@@ -179,7 +172,7 @@ def create_dashboard(tenants_df):
                     line=dict(color="#556270", width=1, dash="dot")
                 )
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, theme=None)
         else:
             st.markdown("""
             <div style="
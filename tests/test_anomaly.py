@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from utils.anomaly import MIN_HISTORY, AnomalyEngine
+
+
+def _series(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range("2024-01-01", periods=n, freq="h")
+    values = 20 + 2 * np.sin(2 * np.pi * np.arange(n) / 24) + rng.normal(0, 0.5, n)
+    values[rng.choice(np.arange(MIN_HISTORY, n), 10, replace=False)] += 8  # Spikes
+    return timestamps, values
+
+
+def test_online_flags_match_backfill_on_cold_start():
+    timestamps, values = _series()
+    replayed = AnomalyEngine().backfill("series", timestamps, values)
+    expected = np.isin(timestamps, replayed.loc[replayed["score"] >= 1.0, "date"])
+
+    live = AnomalyEngine().update_batch(["series"] * len(values), timestamps, values)
+
+    np.testing.assert_array_equal(live, expected)
+    assert live[:200].sum() < 20
+
+
+def test_online_continues_backfilled_state():
+    timestamps, values = _series()
+    split = 300
+    full = AnomalyEngine()
+    full.backfill("series", timestamps, values)
+    resumed = AnomalyEngine()
+    resumed.backfill("series", timestamps[:split], values[:split])
+    live = resumed.update_batch(["series"] * (len(values) - split), timestamps[split:], values[split:])
+
+    history = full.history["series"]
+    np.testing.assert_array_equal(live, np.isin(timestamps[split:], history["date"]))
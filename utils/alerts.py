@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+# ==== ALERT RULES ENGINE ====
+# Rules are rows of a table, evaluated against a rollup snapshot (one row per
+# sensor_type/location series) with merges and array comparisons only, so cost grows
+# with rules x matching series rather than with readings. Fired alerts from rules and
+# from the anomaly engine share one ranking, keeping the strongest alert per series.
+#
+# kind       metric compared with `limit`
+# threshold  latest bucket mean
+# rate       relative change from the previous bucket
+# baseline   relative deviation of the latest bucket from the mean of all earlier ones
+#
+# sensor_type / location may be "*" to match every series.
+
+RULE_COLUMNS = ["rule_id", "kind", "sensor_type", "location", "direction", "limit", "severity"]
+ALERT_COLUMNS = [
+    "rule_id", "kind", "sensor_type", "location", "direction", "limit", "severity",
+    "metric", "current", "last_bucket", "rank"
+]
+WILDCARD = "*"
+
+DEFAULT_RULES = [
+    {"rule_id": "temp-high", "kind": "threshold", "sensor_type": "Temperature", "location": WILDCARD, "direction": "above", "limit": 82.0, "severity": 3},
+    {"rule_id": "temp-low", "kind": "threshold", "sensor_type": "Temperature", "location": WILDCARD, "direction": "below", "limit": 60.0, "severity": 2},
+    {"rule_id": "humidity-high", "kind": "threshold", "sensor_type": "Humidity", "location": WILDCARD, "direction": "above", "limit": 60.0, "severity": 2},
+    {"rule_id": "occupancy-full", "kind": "threshold", "sensor_type": "Occupancy", "location": WILDCARD, "direction": "above", "limit": 95.0, "severity": 1},
+    {"rule_id": "energy-high", "kind": "threshold", "sensor_type": "Energy", "location": WILDCARD, "direction": "above", "limit": 45.0, "severity": 2},
+    {"rule_id": "water-leak", "kind": "threshold", "sensor_type": "Water", "location": WILDCARD, "direction": "above", "limit": 180.0, "severity": 3},
+    {"rule_id": "jump", "kind": "rate", "sensor_type": WILDCARD, "location": WILDCARD, "direction": "above", "limit": 0.35, "severity": 2},
+    {"rule_id": "drop", "kind": "rate", "sensor_type": WILDCARD, "location": WILDCARD, "direction": "below", "limit": -0.35, "severity": 1},
+    {"rule_id": "over-baseline", "kind": "baseline", "sensor_type": WILDCARD, "location": WILDCARD, "direction": "above", "limit": 0.15, "severity": 2},
+    {"rule_id": "under-baseline", "kind": "baseline", "sensor_type": WILDCARD, "location": WILDCARD, "direction": "below", "limit": -0.15, "severity": 1}
+]
+
+# Severity -> (card title, card color)
+ALERT_LEVELS = {
+    3: ("CRITICAL ALERT", "#FF6B6B"),
+    2: ("WARNING", "#FFE66D"),
+    1: ("INFO", "#4ECDC4")
+}
+
+def load_rules(records=DEFAULT_RULES):
+    """Rule table from a list of rule dicts"""
+    return pd.DataFrame.from_records(records, columns=RULE_COLUMNS)
+
+def _match_rules(rules, snapshot):
+    """Pair every rule with the series it applies to, expanding wildcards by merge"""
+    series = snapshot.reset_index()
+    pairs = []
+    for type_wild in (False, True):
+        for location_wild in (False, True):
+            subset = rules[
+                ((rules["sensor_type"] == WILDCARD) == type_wild)
+                & ((rules["location"] == WILDCARD) == location_wild)
+            ]
+            if subset.empty:
+                continue
+            keys = [key for key, wild in (("sensor_type", type_wild), ("location", location_wild)) if not wild]
+            subset = subset.drop(columns=[key for key in ("sensor_type", "location") if key not in keys])
+            pairs.append(subset.merge(series, on=keys) if keys else subset.merge(series, how="cross"))
+    if not pairs:
+        return series.iloc[:0].assign(**{column: [] for column in RULE_COLUMNS})
+    return pd.concat(pairs, ignore_index=True)
+
+def evaluate_rules(rules, snapshot):
+    """Alerts fired by every rule against a rollup snapshot, in one vectorized pass"""
+    pairs = _match_rules(rules, snapshot)
+    kind = pairs["kind"].to_numpy()
+    current = pairs["current"].to_numpy(dtype=np.float64)
+    previous = pairs["previous"].to_numpy(dtype=np.float64)
+    baseline = pairs["baseline"].to_numpy(dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metric = np.select(
+            [kind == "threshold", kind == "rate", kind == "baseline"],
+            [current, (current - previous) / np.abs(previous), (current - baseline) / np.abs(baseline)],
+            np.nan
+        )
+    limit = pairs["limit"].to_numpy(dtype=np.float64)
+    above = pairs["direction"].to_numpy() == "above"
+    fired = np.where(above, metric > limit, metric < limit) & np.isfinite(metric)
+
+    # Rank by severity, then by how far past its limit the metric is
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exceedance = np.abs(metric - limit) / np.maximum(np.abs(limit), 1e-9)
+    rank = pairs["severity"].to_numpy(dtype=np.float64) + np.minimum(exceedance, 0.99)
+
+    alerts = pairs.assign(metric=metric, rank=rank)[fired]
+    return alerts[ALERT_COLUMNS].reset_index(drop=True)
+
+def anomaly_alerts(events):
+    """Alerts from anomaly engine flags (columns key, date, value, z, score, detector)"""
+    if events.empty:
+        return pd.DataFrame(columns=ALERT_COLUMNS)
+    score = events["score"].to_numpy(dtype=np.float64)
+    severity = np.select([score >= 2, score >= 1.5], [3, 2], 1)
+    keys = events["key"].tolist()
+    return pd.DataFrame({
+        "rule_id": "anomaly-" + events["detector"].astype(str),
+        "kind": "anomaly",
+        "sensor_type": [key[0] for key in keys],
+        "location": [key[1] for key in keys],
+        "direction": np.where(events["z"].to_numpy() > 0, "above", "below"),
+        "limit": np.nan,
+        "severity": severity,
+        "metric": events["z"].to_numpy(dtype=np.float64),
+        "current": events["value"].to_numpy(dtype=np.float64),
+        "last_bucket": events["date"].to_numpy(),
+        "rank": severity + np.minimum(score / 10, 0.99)
+    }, columns=ALERT_COLUMNS)
+
+def rank_alerts(*alert_frames, limit=None):
+    """Merge alert frames, keep the strongest alert per series and order by rank"""
+    frames = [frame for frame in alert_frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=ALERT_COLUMNS)
+    alerts = pd.concat(frames, ignore_index=True).sort_values("rank", ascending=False, kind="stable")
+    alerts = alerts.drop_duplicates(["sensor_type", "location"], keep="first").reset_index(drop=True)
+    return alerts if limit is None else alerts.head(limit)
+
+def format_alert(alert, unit=""):
+    """(title, message, color) of an alert card"""
+    title, color = ALERT_LEVELS[int(alert.severity)]
+    where = f"{alert.sensor_type} in {alert.location}"
+    if alert.kind == "threshold":
+        message = f"{where} at {alert.current:.1f}{unit}.<br>{alert.direction.capitalize()} the {alert.limit:g}{unit} limit."
+    elif alert.kind == "rate":
+        message = f"{where} {'up' if alert.metric > 0 else 'down'} {abs(alert.metric):.0%}<br>since the previous reading."
+    elif alert.kind == "baseline":
+        message = f"{where} {abs(alert.metric):.0%} {'above' if alert.metric > 0 else 'below'}<br>its baseline at {alert.current:.1f}{unit}."
+    else:
+        detector = alert.rule_id.split("-", 1)[-1].upper()
+        message = f"{alert.sensor_type} {'spike' if alert.metric > 0 else 'drop'} detected in {alert.location}.<br>{alert.current:.1f}{unit} ({alert.metric:+.1f}σ {detector})"
+    return title, message, color
@@ -0,0 +1,240 @@
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ==== ONLINE ANOMALY DETECTION ====
+# Four detectors score every reading against the state built from the readings
+# before it, then fold the reading into that state in O(1):
+#   welford  - running mean / variance of the whole series
+#   ewma     - exponentially weighted mean / variance, follows drift
+#   seasonal - running mean / variance per hour of day
+#   mad      - median and median absolute deviation of the last MAD_WINDOW readings,
+#              robust to spikes
+# A reading is flagged when any |z| reaches its detector threshold. backfill() gives
+# identical scores for a whole series in vectorized form, so live and replayed
+# readings are flagged the same way.
+
+DETECTOR_THRESHOLDS = {"welford": 3.0, "ewma": 3.0, "seasonal": 3.0, "mad": 3.5}
+DETECTORS = list(DETECTOR_THRESHOLDS)
+EWMA_ALPHA = 0.05
+SEASON_SLOTS = 24  # Hour-of-day baselines
+MIN_HISTORY = 16  # Readings a baseline needs before it may flag
+MAD_WINDOW = 64  # Readings behind the median / MAD
+MAD_CHUNK_ROWS = 16384  # Windows materialized at once during backfill
+MAD_SCALE = 1.4826  # MAD to standard deviation for normal data
+MAX_LIVE_EVENTS = 500  # Live anomalies kept per series
+EVENT_COLUMNS = ["date", "value", "z", "score", "detector"]
+
+class SeriesState:
+    """Running detector state of one series"""
+
+    def __init__(self):
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.ewma, self.ewvar = 0.0, 0.0
+        self.season_count = np.zeros(SEASON_SLOTS, dtype=np.int64)
+        self.season_mean = np.zeros(SEASON_SLOTS)
+        self.season_m2 = np.zeros(SEASON_SLOTS)
+        self.window = deque(maxlen=MAD_WINDOW)  # Latest readings behind the median / MAD
+        self.median, self.mad = 0.0, 0.0
+        self.last = None  # (timestamp, value, score, flagged)
+
+def _z(deviation, spread):
+    """Signed z-score, zero when the spread is not yet defined"""
+    return deviation / spread if spread > 0 else 0.0
+
+def rolling_median_mad(values, window=MAD_WINDOW):
+    """Exact median and MAD of the window ending at each reading"""
+    padded = np.r_[np.full(window - 1, np.nan), values]
+    windows = sliding_window_view(padded, window)
+    median, mad = np.empty(len(values)), np.empty(len(values))
+    for start in range(0, len(values), MAD_CHUNK_ROWS):
+        chunk = windows[start:start + MAD_CHUNK_ROWS]
+        # Only the first window - 1 rows are padded, so plain median suffices after that
+        reduce = np.nanmedian if start < window - 1 else np.median
+        median[start:start + len(chunk)] = reduce(chunk, axis=1)
+        mad[start:start + len(chunk)] = reduce(np.abs(chunk - median[start:start + len(chunk), None]), axis=1)
+    return median, mad
+
+def _strongest(z_scores, thresholds):
+    """(score, signed z, detector) of the detector furthest past its threshold"""
+    best = (0.0, 0.0, "")
+    for detector, z in z_scores.items():
+        score = abs(z) / thresholds[detector]
+        if score > best[0]:
+            best = (score, z, detector)
+    return best
+
+class AnomalyEngine:
+    """Per-series online anomaly detectors with vectorized backfill"""
+
+    def __init__(self, thresholds=DETECTOR_THRESHOLDS, alpha=EWMA_ALPHA):
+        self.thresholds = dict(thresholds)
+        self.alpha = alpha
+        self.states = {}  # key -> SeriesState
+        self.history = {}  # key -> flagged backfilled readings
+        self.live = {}  # key -> deque of flagged live readings
+
+    # ---- online path ----
+
+    def update(self, key, timestamp, value):
+        """Score one reading against its series, then fold it in; returns (flagged, score, z, detector)"""
+        state = self.states.setdefault(key, SeriesState())
+        timestamp = pd.Timestamp(timestamp)
+        slot = timestamp.hour
+        value = float(value)
+
+        z_scores = {}
+        if state.count >= MIN_HISTORY:
+            z_scores["welford"] = _z(value - state.mean, math.sqrt(state.m2 / (state.count - 1)))
+            z_scores["ewma"] = _z(value - state.ewma, math.sqrt(state.ewvar))
+            z_scores["mad"] = _z(value - state.median, MAD_SCALE * state.mad)
+        if state.season_count[slot] >= MIN_HISTORY:
+            spread = math.sqrt(state.season_m2[slot] / (state.season_count[slot] - 1))
+            z_scores["seasonal"] = _z(value - state.season_mean[slot], spread)
+        score, z, detector = _strongest(z_scores, self.thresholds)
+        flagged = score >= 1.0
+
+        # Welford
+        state.count += 1
+        delta = value - state.mean
+        state.mean += delta / state.count
+        state.m2 += delta * (value - state.mean)
+        # EWMA
+        if state.count == 1:
+            state.ewma = value
+        else:
+            diff = value - state.ewma
+            state.ewma += self.alpha * diff
+            state.ewvar = (1 - self.alpha) * (state.ewvar + self.alpha * diff * diff)
+        # Seasonal Welford
+        state.season_count[slot] += 1
+        delta = value - state.season_mean[slot]
+        state.season_mean[slot] += delta / state.season_count[slot]
+        state.season_m2[slot] += delta * (value - state.season_mean[slot])
+        # Exact median / MAD of the window, matching rolling_median_mad in backfill
+        state.window.append(value)
+        window = np.fromiter(state.window, dtype=np.float64, count=len(state.window))
+        state.median = float(np.median(window))
+        state.mad = float(np.median(np.abs(window - state.median)))
+
+        state.last = (timestamp, value, score, flagged)
+        if flagged:
+            self.live.setdefault(key, deque(maxlen=MAX_LIVE_EVENTS)).append((timestamp, value, z, score, detector))
+        return flagged, score, z, detector
+
+    def update_batch(self, keys, timestamps, values):
+        """Update a batch reading by reading; returns the flag of each reading"""
+        return np.array([
+            self.update(key, timestamp, value)[0]
+            for key, timestamp, value in zip(keys, pd.DatetimeIndex(timestamps), np.asarray(values, dtype=np.float64))
+        ], dtype=bool)
+
+    # ---- vectorized path ----
+
+    def backfill(self, key, timestamps, values):
+        """Score a whole date-sorted series at once and leave the online state at its end"""
+        timestamps = pd.DatetimeIndex(timestamps)
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return pd.DataFrame(columns=EVENT_COLUMNS)
+        prior = np.arange(n)
+        series = pd.Series(values)
+
+        # Welford: expanding mean / sample std of the readings before each one
+        sums, sumsqs = np.cumsum(values) - values, np.cumsum(values ** 2) - values ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = sums / prior
+            std = np.sqrt(np.maximum(sumsqs - prior * mean ** 2, 0) / (prior - 1))
+
+        # EWMA: the variance recursion is itself an EWMA of (1 - alpha)·diff²
+        ewma = series.ewm(alpha=self.alpha, adjust=False).mean().to_numpy()
+        ewma_prior = np.r_[values[0], ewma[:-1]]
+        ewvar = pd.Series((1 - self.alpha) * (values - ewma_prior) ** 2).ewm(alpha=self.alpha, adjust=False).mean().to_numpy()
+        ewvar_prior = np.r_[0.0, ewvar[:-1]]
+
+        # Seasonal: expanding stats per hour of day
+        slots = timestamps.hour.to_numpy()
+        by_slot = series.groupby(slots)
+        slot_prior = by_slot.cumcount().to_numpy()
+        slot_sums = by_slot.cumsum().to_numpy() - values
+        slot_sumsqs = (series ** 2).groupby(slots).cumsum().to_numpy() - values ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slot_mean = slot_sums / slot_prior
+            slot_std = np.sqrt(np.maximum(slot_sumsqs - slot_prior * slot_mean ** 2, 0) / (slot_prior - 1))
+
+        # MAD: median / MAD of the previous MAD_WINDOW readings
+        median, mad = rolling_median_mad(values)
+        median_prior, mad_prior = np.r_[np.nan, median[:-1]], np.r_[np.nan, mad[:-1]]
+
+        ready = prior >= MIN_HISTORY
+        slot_ready = slot_prior >= MIN_HISTORY
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.column_stack([
+                np.where(ready & (std > 0), (values - mean) / std, 0.0),
+                np.where(ready & (ewvar_prior > 0), (values - ewma_prior) / np.sqrt(ewvar_prior), 0.0),
+                np.where(slot_ready & (slot_std > 0), (values - slot_mean) / slot_std, 0.0),
+                np.where(ready & (mad_prior > 0), (values - median_prior) / (MAD_SCALE * mad_prior), 0.0)
+            ])
+        z = np.nan_to_num(z)
+        scores = np.abs(z) / np.array([self.thresholds[detector] for detector in DETECTORS])
+        strongest = scores.argmax(axis=1)
+        score = scores[prior, strongest]
+
+        scored = pd.DataFrame({
+            "date": timestamps,
+            "value": values,
+            "z": z[prior, strongest],
+            "score": score,
+            "detector": np.array(DETECTORS)[strongest]
+        })
+        self.history[key] = scored[score >= 1.0].reset_index(drop=True)
+
+        # Leave the online state where the sequential path would be
+        state = SeriesState()
+        state.count, state.mean = n, values.mean()
+        state.m2 = float(((values - state.mean) ** 2).sum())
+        state.ewma, state.ewvar = ewma[-1], ewvar[-1]
+        state.season_count = np.bincount(slots, minlength=SEASON_SLOTS)
+        state.season_mean = np.bincount(slots, values, SEASON_SLOTS) / np.maximum(state.season_count, 1)
+        state.season_m2 = np.bincount(slots, (values - state.season_mean[slots]) ** 2, SEASON_SLOTS)
+        state.window = deque(values[-MAD_WINDOW:].tolist(), maxlen=MAD_WINDOW)
+        state.median, state.mad = median[-1], mad[-1]
+        state.last = (timestamps[-1], values[-1], score[-1], score[-1] >= 1.0)
+        self.states[key] = state
+        return scored
+
+    # ---- queries ----
+
+    def anomalies(self, key, start=None, end=None):
+        """Flagged readings of one series inside [start, end], newest first"""
+        live = pd.DataFrame(list(self.live.get(key, ())), columns=EVENT_COLUMNS)
+        frames = [frame for frame in (self.history.get(key), live) if frame is not None and not frame.empty]
+        events = pd.concat(frames, ignore_index=True) if frames else live
+        if start is not None:
+            events = events[events["date"] >= pd.Timestamp(start)]
+        if end is not None:
+            events = events[events["date"] <= pd.Timestamp(end)]
+        return events.sort_values("date", ascending=False, kind="stable", ignore_index=True)
+
+    def recent(self, since=None, limit=None):
+        """Flagged readings of every series since a timestamp, most severe first"""
+        frames = []
+        for key in self.states:
+            events = self.anomalies(key, start=since)
+            if not events.empty:
+                events.insert(0, "key", pd.Series([key] * len(events), index=events.index, dtype=object))
+                frames.append(events)
+        events = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["key"] + EVENT_COLUMNS)
+        events = events.sort_values(["score", "date"], ascending=False, kind="stable", ignore_index=True)
+        return events if limit is None else events.head(limit)
+
+    def status(self):
+        """Latest reading, score and flag of every series"""
+        return pd.DataFrame(
+            [(key, *state.last) for key, state in self.states.items() if state.last is not None],
+            columns=["key", "date", "value", "score", "flagged"]
+        )
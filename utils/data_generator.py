@@ -1,47 +1,243 @@
-import plotly.graph_objects as go
-
-def apply_retro_style_to_figure(fig, title=None):
-    """Apply retro gaming styling to a plotly figure"""
-    fig.update_layout(
-        title=title,
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font=dict(family="VT323", size=14, color="white"),
-        title_font=dict(family="VT323", size=24, color="white"),
-        legend_title_font=dict(family="VT323", size=12),
-        legend_font=dict(family="VT323", size=12),
-        xaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323")),
-        yaxis=dict(gridcolor="#556270", tickfont=dict(family="VT323"))
-    )
-    return fig
-
-def create_pixel_gauge(value, title, min_val=0, max_val=100, color="#4ECDC4", suffix=""):
-    """Create a gauge chart with retro pixel styling"""
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=value,
-        domain={"x": [0, 1], "y": [0, 1]},
-        title={"text": title, "font": {"family": "VT323", "size": 24}},
-        gauge={
-            "axis": {"range": [min_val, max_val], "tickfont": {"family": "VT323"}},
-            "bar": {"color": color},
-            "bgcolor": "white",
-            "borderwidth": 2,
-            "bordercolor": "black",
-            "steps": [
-                {"range": [min_val, min_val + (max_val-min_val)*0.5], "color": "lightgray"},
-                {"range": [min_val + (max_val-min_val)*0.5, value], "color": color}
-            ],
-        },
-        number={"font": {"family": "VT323", "size": 40}, "suffix": suffix}
-    ))
-    
-    fig.update_layout(
-        height=200,
-        plot_bgcolor="#2A2A72",
-        paper_bgcolor="#2A2A72",
-        font={"family": "VT323", "color": "white"},
-        margin=dict(l=30, r=30, t=50, b=30)
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# ==== IOT SENSOR PROFILES ====
+# Lookup tables indexed by sensor type code; sensor N uses type (N - 1) % len(SENSOR_TYPES)
+
+SENSOR_TYPES = ["Temperature", "Humidity", "Occupancy", "Energy", "Water"]
+SENSOR_BASE_VALUES = np.array([72.0, 45.0, 65.0, 30.0, 120.0])  # °F, %, %, kWh, gal
+SENSOR_FLUCTUATIONS = np.array([5.0, 10.0, 20.0, 15.0, 30.0])
+SENSOR_UNITS = ["°F", "%", "%", "kWh", "gal"]
+UNIT_CATEGORIES = list(dict.fromkeys(SENSOR_UNITS))
+SENSOR_UNIT_CODES = np.array([UNIT_CATEGORIES.index(unit) for unit in SENSOR_UNITS])
+SENSOR_ZONES = ["Zone-1", "Zone-2", "Zone-3"]
+
+ANOMALY_RATE = 0.01  # Share of readings turned into spikes
+IOT_CHUNK_ROWS = 1_000_000  # Rows generated per vectorized block
+TABLE_CHUNK_ROWS = 250_000  # Properties / tenants generated per random stream
+
+PROPERTY_TYPES = ["Residential", "Commercial", "Retail", "Industrial", "Mixed-Use"]
+PROPERTY_CITIES = ["New York", "San Francisco", "Chicago", "Miami", "Austin", "Seattle", "Boston"]
+BUSINESS_TYPES = ["Retail", "Office", "Restaurant", "Medical", "Tech", "Financial"]
+LEASE_TERMS = [1, 2, 3, 5, 10]
+
+# Sample renewal outcomes: log-odds per unit of each feature around a typical tenant
+RENEWAL_INTERCEPT = 0.8
+RENEWAL_WEIGHTS = {
+    "satisfaction_score": 0.08,
+    "service_requests_monthly": -0.25,
+    "rent_per_sqft": -0.6,  # Per log unit of rent per sqft
+    "lease_term_years": 0.15,
+    "months_to_expiration": 0.02
+}
+
+# ==== RANDOM STREAMS ====
+# Every generator accepts an int seed, a SeedSequence or a Generator. Chunk i of a
+# dataset always draws from child stream i of the root seed, so chunked output is
+# identical whether chunks run serially or across any number of worker processes.
+
+def seed_sequence(seed=None):
+    """Normalize an int, SeedSequence or Generator into a root SeedSequence"""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return np.random.SeedSequence(int(seed.integers(2**63)))
+    return np.random.SeedSequence(seed)
+
+def child_seed(root, index):
+    """Return the index-th child of a SeedSequence without mutating it"""
+    return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (index,), pool_size=root.pool_size)
+
+def spawn_streams(seed, num_streams):
+    """Spawn independent child Generators for parallel chunks"""
+    root = seed_sequence(seed)
+    return [np.random.default_rng(child_seed(root, i)) for i in range(num_streams)]
+
+def _run_chunks(func, tasks, workers=1):
+    """Run func over argument tuples, across a process pool when workers > 1"""
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, *zip(*tasks)))
+    return [func(*task) for task in tasks]
+
+def _table_tasks(num_rows, seed):
+    """Split a table into (start, stop, stream seed) chunks"""
+    root = seed_sequence(seed)
+    return [
+        (start, min(start + TABLE_CHUNK_ROWS, num_rows), child_seed(root, i))
+        for i, start in enumerate(range(0, num_rows, TABLE_CHUNK_ROWS))
+    ]
+
+# ==== GENERATORS ====
+
+def _property_chunk(start, stop, stream_seed):
+    """Generate properties start+1..stop from one random stream"""
+    rng = np.random.default_rng(stream_seed)
+    n = stop - start
+    ids = range(start + 1, stop + 1)
+
+    data = {
+        "property_id": [f"PROP-{i:03d}" for i in ids],
+        "name": [f"Property {chr(65 + i % 26)}{i}" for i in ids],
+        "type": rng.choice(PROPERTY_TYPES, n),
+        "location": rng.choice(PROPERTY_CITIES, n),
+        "size_sqft": rng.integers(5000, 100000, n, endpoint=True),
+        "occupancy_rate": rng.uniform(0.7, 1.0, n),
+        "revenue_per_sqft": rng.uniform(20, 100, n),
+        "energy_rating": rng.integers(50, 100, n, endpoint=True),
+        "smart_devices": rng.integers(5, 50, n, endpoint=True),
+        "maintenance_score": rng.integers(60, 100, n, endpoint=True)
+    }
+
+    return pd.DataFrame(data)
+
+def generate_sample_property_data(num_properties=10, seed=None, workers=1):
+    """Generate sample property data for demo purposes"""
+    chunks = _run_chunks(_property_chunk, _table_tasks(num_properties, seed), workers)
+    return pd.concat(chunks, ignore_index=True) if chunks else _property_chunk(0, 0, seed_sequence(seed))
+
+def _sensor_values(timestamps, type_codes, rng):
+    """Vectorized sensor readings for a timestamps x sensors grid"""
+    shape = (len(timestamps), len(type_codes))
+
+    # Time-based patterns, broadcast over sensors
+    hours = timestamps.hour.to_numpy() + timestamps.minute.to_numpy() / 60
+    hour_factor = 1 + 0.2 * np.sin(2 * np.pi * hours / 24)
+    day_factor = 1 + 0.1 * np.sin(2 * np.pi * timestamps.weekday.to_numpy() / 7)
+    time_factor = (hour_factor * day_factor)[:, None]
+
+    base = SENSOR_BASE_VALUES[type_codes][None, :]
+    fluctuation = SENSOR_FLUCTUATIONS[type_codes][None, :]
+
+    values = base * time_factor * rng.uniform(0.9, 1.1, shape)
+    values += rng.uniform(-1, 1, shape) * fluctuation
+
+    # Inject occasional anomalies
+    anomalies = rng.random(shape) < ANOMALY_RATE
+    values[anomalies] *= rng.uniform(1.5, 2.0, anomalies.sum())
+    return values
+
+def _iot_timeline(num_days, freq, end=None):
+    """Return (first timestamp, sampling step, number of timestamps) ending at end"""
+    step = pd.Timedelta(pd.tseries.frequencies.to_offset(freq))
+    num_periods = int(pd.Timedelta(days=num_days) // step)
+    end = pd.Timestamp(datetime.now() if end is None else end).as_unit("ns")
+    return end - step * (num_periods - 1), step, num_periods
+
+def _iot_block(start, step, first, last, num_sensors, stream_seed):
+    """Generate timestamps first..last-1 of a timeline from one random stream"""
+    rng = np.random.default_rng(stream_seed)
+    timestamps = pd.DatetimeIndex(start + step * np.arange(first, last))
+    values = _sensor_values(timestamps, np.arange(num_sensors) % len(SENSOR_TYPES), rng).ravel()
+    zone_codes = rng.integers(0, len(SENSOR_ZONES), values.size, dtype=np.int8)
+    return timestamps, values, zone_codes
+
+def _iot_tasks(num_days, num_sensors, freq, chunk_rows, seed, end):
+    """Split an IoT timeline into per-block argument tuples with their own streams"""
+    start, step, num_periods = _iot_timeline(num_days, freq, end)
+    root = seed_sequence(seed)
+    block_periods = max(1, chunk_rows // max(num_sensors, 1))
+    return [
+        (start, step, first, min(first + block_periods, num_periods), num_sensors, child_seed(root, i))
+        for i, first in enumerate(range(0, num_periods, block_periods))
+    ]
+
+def _iot_frame(timestamps, values, zone_codes, num_sensors):
+    """Assemble a date-major, sensor-minor IoT frame from column arrays"""
+    sensor_codes = np.tile(np.arange(num_sensors), len(timestamps))
+    type_codes = sensor_codes % len(SENSOR_TYPES)
+    return pd.DataFrame({
+        "date": timestamps.repeat(num_sensors),
+        "sensor_id": pd.Categorical.from_codes(
+            sensor_codes,
+            [f"S-{sensor_id:03d}" for sensor_id in range(1, num_sensors + 1)]
+        ),
+        "sensor_type": pd.Categorical.from_codes(type_codes, SENSOR_TYPES),
+        "value": values,
+        "unit": pd.Categorical.from_codes(SENSOR_UNIT_CODES[type_codes], UNIT_CATEGORIES),
+        "location": pd.Categorical.from_codes(zone_codes, SENSOR_ZONES)
+    })
+
+def iter_iot_sensor_data(num_days=30, num_sensors=5, freq="1D", chunk_rows=IOT_CHUNK_ROWS, seed=None, end=None):
+    """Lazily yield IoT sensor data as DataFrame chunks of at most chunk_rows readings"""
+    for task in _iot_tasks(num_days, num_sensors, freq, chunk_rows, seed, end):
+        yield _iot_frame(*_iot_block(*task), num_sensors)
+
+def generate_iot_sensor_data(num_days=30, num_sensors=5, freq="1D", seed=None, end=None, workers=1):
+    """Generate sample IoT sensor data sampled every freq (e.g. "1min", "15min", "1h", "1D")"""
+    tasks = _iot_tasks(num_days, num_sensors, freq, IOT_CHUNK_ROWS, seed, end)
+    num_periods = tasks[-1][3] if tasks else 0
+    num_rows = num_periods * num_sensors
+
+    # Preallocated columns filled block by block, so temporaries stay at IOT_CHUNK_ROWS
+    timestamps = np.empty(num_periods, dtype="datetime64[ns]")
+    values = np.empty(num_rows)
+    zone_codes = np.empty(num_rows, dtype=np.int8)
+
+    if workers > 1:
+        blocks = _run_chunks(_iot_block, tasks, workers)
+    else:
+        blocks = (_iot_block(*task) for task in tasks)
+
+    for task, (block_timestamps, block_values, block_zones) in zip(tasks, blocks):
+        first, last = task[2], task[3]
+        timestamps[first:last] = block_timestamps.to_numpy()
+        values[first * num_sensors:last * num_sensors] = block_values
+        zone_codes[first * num_sensors:last * num_sensors] = block_zones
+
+    return _iot_frame(pd.DatetimeIndex(timestamps), values, zone_codes, num_sensors)
+
+def _tenant_chunk(start, stop, stream_seed, as_of):
+    """Generate tenants start+1..stop from one random stream"""
+    rng = np.random.default_rng(stream_seed)
+    n = stop - start
+    ids = range(start + 1, stop + 1)
+
+    data = {
+        "tenant_id": [f"TEN-{i:03d}" for i in ids],
+        "name": [f"Tenant {chr(65 + i % 26)}{i}" for i in ids],
+        "business_type": rng.choice(BUSINESS_TYPES, n),
+        "lease_term_years": rng.choice(LEASE_TERMS, n),
+        "lease_start": as_of - pd.to_timedelta(rng.integers(30, 1000, n, endpoint=True), unit="D"),
+        "monthly_rent": rng.integers(2000, 15000, n, endpoint=True),
+        "space_utilized_sqft": rng.integers(1000, 10000, n, endpoint=True),
+        "satisfaction_score": rng.integers(60, 100, n, endpoint=True),
+        "service_requests_monthly": rng.integers(0, 10, n, endpoint=True)
+    }
+
+    df = pd.DataFrame(data)
+    # Lease end dates and time to expiry, vectorized per chunk
+    df["lease_end"] = df["lease_start"] + pd.to_timedelta(df["lease_term_years"].to_numpy() * 365, unit="D")
+    df["months_to_expiration"] = months_until(df["lease_end"], as_of)
+    # Retention odds and the observed renewal outcome drawn from them, the label the
+    # retention model trains on
+    df.insert(df.columns.get_loc("service_requests_monthly"), "retention_probability", renewal_probability(df))
+    df["renewed"] = rng.random(n) < df["retention_probability"].to_numpy()
+    return df
+
+def renewal_probability(tenants):
+    """True renewal odds behind the sample outcomes, as a logistic function of tenant features"""
+    rent_per_sqft = tenants["monthly_rent"].to_numpy() / tenants["space_utilized_sqft"].to_numpy()
+    logit = (
+        RENEWAL_INTERCEPT
+        + RENEWAL_WEIGHTS["satisfaction_score"] * (tenants["satisfaction_score"].to_numpy() - 80)
+        + RENEWAL_WEIGHTS["service_requests_monthly"] * (tenants["service_requests_monthly"].to_numpy() - 5)
+        + RENEWAL_WEIGHTS["rent_per_sqft"] * np.log(rent_per_sqft)
+        + RENEWAL_WEIGHTS["lease_term_years"] * (tenants["lease_term_years"].to_numpy() - 3)
+        + RENEWAL_WEIGHTS["months_to_expiration"] * np.clip(tenants["months_to_expiration"].to_numpy(), -24, 120)
     )
-    
-    return fig
\ No newline at end of file
+    return 1 / (1 + np.exp(-logit))
+
+def generate_tenant_data(num_tenants=20, seed=None, workers=1):
+    """Generate sample tenant data"""
+    as_of = pd.Timestamp(datetime.now())
+    tasks = [task + (as_of,) for task in _table_tasks(num_tenants, seed)]
+    chunks = _run_chunks(_tenant_chunk, tasks, workers)
+    return pd.concat(chunks, ignore_index=True) if chunks else _tenant_chunk(0, 0, seed_sequence(seed), as_of)
+
+def months_until(dates, as_of=None):
+    """Vectorized whole days from as_of to each date, expressed in 30-day months"""
+    as_of = pd.Timestamp(datetime.now() if as_of is None else as_of).normalize()
+    return (dates.dt.normalize() - as_of).dt.days / 30
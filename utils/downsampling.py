@@ -0,0 +1,93 @@
+import numpy as np
+
+# ==== TIME-SERIES DOWNSAMPLING ====
+# Reduce a series to roughly one or two points per horizontal pixel before it is
+# serialized for the browser. Both modes always keep the first and last points.
+
+DEFAULT_CHART_WIDTH = 800  # Approximate plot width in pixels for a wide-layout chart
+POINTS_PER_PIXEL = 1
+
+def target_points_for_width(width_px=DEFAULT_CHART_WIDTH, points_per_pixel=POINTS_PER_PIXEL):
+    """Number of points worth sending for a chart of the given pixel width"""
+    return max(3, int(width_px * points_per_pixel))
+
+def _numeric_x(x, n):
+    """Return x as float64 positions, falling back to the row index"""
+    if x is None:
+        return np.arange(n, dtype=np.float64)
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(np.float64)
+    return np.arange(n, dtype=np.float64)
+
+def lttb_indices(y, target_points, x=None):
+    """Largest-Triangle-Three-Buckets: indices of the points that best keep the series shape"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if target_points >= n or target_points < 3:
+        return np.arange(n)
+    x = _numeric_x(x, n)
+
+    # Interior points split into target_points - 2 buckets
+    edges = np.linspace(1, n - 1, target_points - 1).astype(np.int64)
+    selected = np.empty(target_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(target_points - 2):
+        start, stop = edges[i], max(edges[i + 1], edges[i] + 1)
+        next_start, next_stop = stop, edges[i + 2] if i + 2 < len(edges) else n
+        next_stop = max(next_stop, next_start + 1)
+
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+
+    return selected
+
+def minmax_indices(y, target_points):
+    """Min/max per bucket: indices of each bucket's lowest and highest point"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if target_points >= n or target_points < 4:
+        return np.arange(n)
+
+    num_buckets = max(1, (target_points - 2) // 2)
+    buckets = np.arange(n) * num_buckets // n
+    starts = np.searchsorted(buckets, np.arange(num_buckets))
+    columns = np.arange(n) - starts[buckets]
+
+    # Lay buckets out as padded rows so argmin/argmax run as one vectorized pass
+    grid = np.full((num_buckets, columns.max() + 1), np.inf)
+    grid[buckets, columns] = y
+    firsts = starts + grid.argmin(axis=1)
+    grid[buckets, columns] = -y
+    lasts = starts + grid.argmin(axis=1)
+
+    return np.unique(np.r_[0, firsts, lasts, n - 1])
+
+def downsample_indices(y, target_points, mode="lttb", x=None):
+    """Indices of a decimated series using "lttb" or "minmax" mode"""
+    if mode == "minmax":
+        return minmax_indices(y, target_points)
+    if mode == "lttb":
+        return lttb_indices(y, target_points, x)
+    raise ValueError(f"Unknown downsampling mode: {mode}")
+
+def downsample_frame(df, x_column, y_column, target_points=None, mode="lttb"):
+    """Downsample a frame ordered by x_column to about target_points rows"""
+    if target_points is None:
+        target_points = target_points_for_width()
+    if len(df) <= target_points:
+        return df
+    x = df[x_column].to_numpy()
+    return df.iloc[downsample_indices(df[y_column].to_numpy(), target_points, mode, x)]
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+# ==== MONTE CARLO REVENUE FORECAST ====
+# Monthly revenue = base x growth^(t) x occupancy^(t) x seasonality x strategy x noise,
+# with t in years. Each path draws its own annual growth and occupancy change around
+# the slider values plus independent monthly noise, so a whole simulation is a few
+# (paths x months) array operations. Percentiles across paths give the forecast bands.
+
+BASE_MONTHLY_REVENUE = 500_000  # Starting monthly revenue ($)
+STRATEGY_FACTORS = {"Conservative": 0.8, "Balanced": 1.0, "Aggressive": 1.2}
+Q4_START_MONTH = 9  # Months of each forecast year from here on get the seasonal boost
+SEASONAL_BOOST = 1.1
+GROWTH_SD = 1.5  # Spread of each path's annual growth around the slider value (pct points)
+OCCUPANCY_SD = 2.0  # Spread of each path's occupancy change (pct points)
+MONTHLY_NOISE = 0.02  # Uniform monthly noise, +/- share of revenue
+NUM_PATHS = 10_000
+BAND_PERCENTILES = (10, 50, 90)
+
+def seasonal_factors(horizon):
+    """Seasonality of forecast months 1..horizon"""
+    month_of_year = np.arange(horizon) % 12 + 1
+    return np.where(month_of_year >= Q4_START_MONTH, SEASONAL_BOOST, 1.0)
+
+def expected_revenue(growth_rate, occupancy_change, strategy_factor, horizon=12, base_revenue=BASE_MONTHLY_REVENUE):
+    """Noise-free monthly revenue; inputs broadcast together and gain a trailing month axis"""
+    growth_rate, occupancy_change, strategy_factor = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (growth_rate, occupancy_change, strategy_factor))
+    )
+    years = np.arange(1, horizon + 1) / 12
+    log_rate = np.log1p(growth_rate / 100) + np.log1p(occupancy_change / 100)
+    return base_revenue * np.exp(log_rate[..., None] * years) * seasonal_factors(horizon) * strategy_factor[..., None]
+
+def _draw_market(rng, growth_rate, occupancy_change, num_paths):
+    growth = rng.normal(growth_rate, GROWTH_SD, num_paths)
+    occupancy = rng.normal(occupancy_change, OCCUPANCY_SD, num_paths)
+    # Neither revenue growth nor occupancy can fall by more than everything
+    return np.maximum(growth, -99.0), np.maximum(occupancy, -99.0)
+
+def market_paths(growth_rate, occupancy_change, num_paths=NUM_PATHS, seed=None):
+    """(growth %, occupancy change %) of each path, to share between simulations of one market"""
+    return _draw_market(np.random.default_rng(seed), growth_rate, occupancy_change, num_paths)
+
+def simulate_revenue(growth_rate, occupancy_change, strategy_factor, horizon=12, num_paths=NUM_PATHS,
+                     seed=None, base_revenue=BASE_MONTHLY_REVENUE, market=None):
+    """(num_paths, horizon) array of simulated monthly revenue
+
+    market is a (growth, occupancy) pair from market_paths shared with other
+    simulations; only the monthly noise is then drawn from seed.
+    """
+    rng = np.random.default_rng(seed)
+    growth, occupancy = _draw_market(rng, growth_rate, occupancy_change, num_paths) if market is None else market
+    paths = expected_revenue(growth, occupancy, strategy_factor, horizon, base_revenue)
+    paths *= rng.uniform(1 - MONTHLY_NOISE, 1 + MONTHLY_NOISE, paths.shape)
+    return paths
+
+def revenue_bands(paths, percentiles=BAND_PERCENTILES):
+    """Per-month percentiles (columns p10, p50, ...) and mean of simulated paths"""
+    bands = np.percentile(paths, percentiles, axis=0)
+    table = pd.DataFrame({f"p{p}": band for p, band in zip(percentiles, bands)})
+    table.insert(0, "month", np.arange(1, paths.shape[1] + 1))
+    table["mean"] = paths.mean(axis=0)
+    return table
+
+def annual_revenue(paths, percentiles=BAND_PERCENTILES):
+    """Percentiles of each path's first-year revenue total"""
+    totals = paths[:, :12].sum(axis=1)
+    return dict(zip((f"p{p}" for p in percentiles), np.percentile(totals, percentiles)))
+
+# ==== SCENARIO SWEEP ====
+# The noise-free forecast of every growth x occupancy x strategy combination in one
+# broadcast, so slider moves only index into the tensor.
+
+def slider_values(minimum, maximum, step):
+    """Every value a slider can take"""
+    return np.linspace(minimum, maximum, int(round((maximum - minimum) / step)) + 1)
+
+class RevenueSweep:
+    """Expected monthly revenue over a grid of forecast inputs, shape (growth, occupancy, strategy, month)"""
+
+    def __init__(self, growth_values, occupancy_values, strategies=tuple(STRATEGY_FACTORS), horizon=12,
+                 base_revenue=BASE_MONTHLY_REVENUE):
+        self.growth_values = np.asarray(growth_values, dtype=np.float64)
+        self.occupancy_values = np.asarray(occupancy_values, dtype=np.float64)
+        self.strategies = list(strategies)
+        factors = np.array([STRATEGY_FACTORS[strategy] for strategy in self.strategies])
+        self.revenue = expected_revenue(
+            self.growth_values[:, None, None], self.occupancy_values[None, :, None], factors[None, None, :],
+            horizon, base_revenue
+        )
+        self.annual = self.revenue[..., :12].sum(axis=-1)  # First-year revenue per scenario
+
+    @staticmethod
+    def _position(axis, value):
+        """Index of the grid value nearest to value (axes are sorted)"""
+        i = int(np.clip(np.searchsorted(axis, value), 1, len(axis) - 1))
+        return i if abs(axis[i] - value) < abs(axis[i - 1] - value) else i - 1
+
+    def forecast(self, growth_rate, occupancy_change, strategy):
+        """Monthly revenue of the grid scenario nearest to the inputs"""
+        return self.revenue[
+            self._position(self.growth_values, growth_rate),
+            self._position(self.occupancy_values, occupancy_change),
+            self.strategies.index(strategy)
+        ]
+
+    def annual_grid(self, strategy):
+        """First-year revenue of one strategy, growth rates as rows and occupancy changes as columns"""
+        return pd.DataFrame(
+            self.annual[:, :, self.strategies.index(strategy)],
+            index=pd.Index(self.growth_values, name="growth_rate"),
+            columns=pd.Index(self.occupancy_values, name="occupancy_change")
+        )
@@ -1,11 +1,29 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+
+def index_by_date(df, date_column):
+    """Return df sorted by date_column and indexed by it, enabling binary-search date filters"""
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.name == date_column:
+        return df if df.index.is_monotonic_increasing else df.sort_index(kind="stable")
+    return df.sort_values(date_column, kind="stable").set_index(date_column, drop=False)
+
+def encode_property_names(properties_df):
+    """Store property names as a categorical so selections compare integer codes"""
+    if isinstance(properties_df["name"].dtype, pd.CategoricalDtype):
+        return properties_df
+    return properties_df.assign(name=properties_df["name"].astype("category"))
 
 def filter_properties_by_selection(properties_df, selected_properties):
     """Filter properties dataframe based on selected property names"""
     if not selected_properties:
         return properties_df
-    return properties_df[properties_df["name"].isin(selected_properties)]
+    names = properties_df["name"]
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Look the selection up once in the categories, then match integer codes
+        wanted = names.cat.categories.get_indexer(list(selected_properties))
+        return properties_df[np.isin(names.cat.codes.to_numpy(), wanted[wanted >= 0])]
+    return properties_df[names.isin(selected_properties)]
 
 def filter_data_by_date_range(df, date_column, start_date, end_date):
     """Filter dataframe by date range"""
@@ -14,6 +32,13 @@ def filter_data_by_date_range(df, date_column, start_date, end_date):
     if not isinstance(end_date, pd.Timestamp):
         end_date = pd.Timestamp(end_date)
     
+    # Sorted DatetimeIndex (see index_by_date): O(log n) slice instead of a full scan
+    index = df.index
+    if isinstance(index, pd.DatetimeIndex) and index.name == date_column and index.is_monotonic_increasing:
+        start = index.searchsorted(start_date, side="left")
+        stop = index.searchsorted(end_date, side="right")
+        return df.iloc[start:stop]
+    
     filtered_df = df[(df[date_column] >= start_date) & (df[date_column] <= end_date)]
     return filtered_df
 
@@ -0,0 +1,180 @@
+import json
+import socket
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.ring_buffer import RingBufferStore
+from utils.schema import apply_schema
+
+# ==== STREAMING IOT INGESTION ====
+# A source yields batches of readings (date, sensor_id, sensor_type, value, unit,
+# location). The pipeline appends each batch to per-sensor ring buffers and merges it into
+# the rollups and anomaly state, so pages pick up new readings without reloading
+# history. Sources are polled, never blocking a Streamlit rerun, and at most once per
+# poll interval, so a feed shared by many sessions advances at the same pace as one.
+# Replayed readings are restamped to the wall clock and ingested as new readings.
+
+READING_COLUMNS = ["date", "sensor_id", "sensor_type", "value", "unit", "location"]
+BUFFER_SIZE = 1000  # Readings kept per sensor
+
+def parse_readings(lines):
+    """Parse JSON-lines readings into an IoT frame with the compact schema"""
+    records = [json.loads(line) for line in lines if line.strip()]
+    df = pd.DataFrame.from_records(records, columns=READING_COLUMNS)
+    df["date"] = pd.to_datetime(df["date"])
+    return apply_schema(df, "iot")
+
+def format_readings(readings):
+    """Serialize an IoT frame as JSON lines, the wire format of the file and socket sources"""
+    frame = readings[READING_COLUMNS].astype({"date": str, "value": float})
+    return "".join(json.dumps(record) + "\n" for record in frame.to_dict("records"))
+
+class ReplaySource:
+    """Replays recorded readings one timestamp at a time, optionally restamped to the wall clock"""
+
+    def __init__(self, readings, loop=True, restamp=True):
+        self.readings = readings[READING_COLUMNS].reset_index(drop=True)
+        dates = self.readings["date"].to_numpy()
+        self.bounds = np.r_[0, np.flatnonzero(dates[1:] != dates[:-1]) + 1, len(dates)]
+        self.loop = loop
+        self.restamp = restamp
+        self.position = 0
+
+    def poll(self, max_batches=1):
+        """Next max_batches timestamps worth of readings"""
+        if self.position >= len(self.bounds) - 1:
+            if not self.loop or len(self.bounds) < 2:
+                return self.readings.iloc[:0]
+            self.position = 0
+        stop = min(self.position + max_batches, len(self.bounds) - 1)
+        batch = self.readings.iloc[self.bounds[self.position]:self.bounds[stop]].copy()
+        self.position = stop
+        if self.restamp:
+            batch["date"] = pd.Timestamp(datetime.now())
+        return batch
+
+class FileTailSource:
+    """Tails a JSON-lines file, returning readings appended since the last poll"""
+
+    def __init__(self, path, from_start=False):
+        self.path = Path(path)
+        self.offset = 0 if from_start or not self.path.exists() else self.path.stat().st_size
+
+    def poll(self, max_lines=10000):
+        """Complete lines written since the previous poll"""
+        if not self.path.exists():
+            return parse_readings([])
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read()
+        # Leave a partially written last line for the next poll
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        lines = complete.decode("utf-8").splitlines()[:max_lines]
+        self.offset += sum(len(line.encode("utf-8")) + 1 for line in lines)
+        return parse_readings(lines)
+
+class SocketSource:
+    """Reads JSON-lines readings from a TCP socket, a local stand-in for a message broker"""
+
+    def __init__(self, host="127.0.0.1", port=9099, timeout=0.05):
+        self.address = (host, port)
+        self.timeout = timeout
+        self.connection = None
+        self.pending = b""
+
+    def poll(self, max_bytes=1 << 20):
+        """Readings received since the previous poll"""
+        try:
+            if self.connection is None:
+                self.connection = socket.create_connection(self.address, timeout=self.timeout)
+            self.pending += self.connection.recv(max_bytes)
+        except socket.timeout:
+            pass
+        except OSError:
+            # Broker unavailable; reconnect on the next poll
+            self.connection = None
+        complete, _, self.pending = self.pending.rpartition(b"\n")
+        return parse_readings(complete.decode("utf-8").splitlines())
+
+class IngestionPipeline:
+    """Feeds polled readings into ring buffers, the rollups and the anomaly state"""
+
+    def __init__(self, source, rollups, engine, buffer_size=BUFFER_SIZE, poll_interval=0.0):
+        self.source = source
+        self.rollups = rollups
+        self.poll_interval = poll_interval  # Minimum seconds between source polls
+        self.last_poll = None
+        self.engine = engine  # AnomalyEngine keyed by (sensor_type, location)
+        self.sensor_buffers = RingBufferStore(buffer_size)  # sensor_id -> recent readings
+        self.series_buffers = RingBufferStore(buffer_size)  # (sensor_type, location) -> recent readings
+        self.sensors = {}  # sensor_id -> (sensor_type, unit, location) of its latest reading
+        self.rows_ingested = 0
+        self.lock = threading.Lock()
+
+    def poll(self):
+        """Pull one batch from the source and ingest it unless the last poll was under poll_interval ago
+
+        Returns the number of readings ingested.
+        """
+        with self.lock:
+            now = time.monotonic()
+            if self.last_poll is not None and now - self.last_poll < self.poll_interval:
+                return 0
+            self.last_poll = now
+            batch = self.source.poll()
+            if not batch.empty:
+                self.ingest(batch)
+            return len(batch)
+
+    def prime(self, readings):
+        """Fill the ring buffers from stored readings already counted in the rollups"""
+        self._buffer(readings.sort_values("date", kind="stable", ignore_index=True))
+
+    def _buffer(self, batch):
+        """Append a date-ordered batch to the per-sensor and per-series ring buffers"""
+        dates, values = batch["date"].to_numpy(), batch["value"].to_numpy()
+        sensor_ids = batch["sensor_id"].astype(str).to_numpy()
+        sensor_types, locations = batch["sensor_type"].astype(str).to_numpy(), batch["location"].astype(str).to_numpy()
+        self.sensor_buffers.extend(sensor_ids, dates, values)
+        self.series_buffers.extend(zip(sensor_types, locations), dates, values)
+
+        last = batch.drop_duplicates("sensor_id", keep="last")
+        self.sensors.update(zip(
+            last["sensor_id"].astype(str),
+            zip(last["sensor_type"].astype(str), last["unit"].astype(str), last["location"].astype(str))
+        ))
+
+    def ingest(self, batch):
+        """Merge a batch of readings into every piece of live state"""
+        batch = batch.sort_values("date", kind="stable", ignore_index=True)
+        self._buffer(batch)
+        self.engine.update_batch(
+            zip(batch["sensor_type"].astype(str), batch["location"].astype(str)),
+            batch["date"],
+            batch["value"]
+        )
+        self.rollups.update(batch)
+        self.rows_ingested += len(batch)
+
+    def latest(self):
+        """Latest reading per sensor, read from the ring buffer heads"""
+        sensor_ids, dates, values = self.sensor_buffers.latest_all()
+        sensors = [self.sensors[sensor_id] for sensor_id in sensor_ids]
+        return pd.DataFrame({
+            "date": dates,
+            "sensor_id": sensor_ids,
+            "sensor_type": [sensor[0] for sensor in sensors],
+            "value": values,
+            "unit": [sensor[1] for sensor in sensors],
+            "location": [sensor[2] for sensor in sensors]
+        }, columns=READING_COLUMNS).sort_values("sensor_id", ignore_index=True)
+
+    def current(self, sensor_type, location, default=None):
+        """Latest value of one (sensor_type, location) series in O(1)"""
+        latest = self.series_buffers.latest((sensor_type, location))
+        return default if latest is None else latest[1]
@@ -0,0 +1,67 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# ==== HEADLINE KPIS ====
+# Every headline metric of a dataset comes out of one pass over its column arrays.
+# Callers memoize the result by dataset fingerprint and filter. Tenant metrics cover
+# the leases active on a date, so the prior period is the same metrics over the
+# leases active KPI_PERIOD_DAYS earlier. Properties carry no dates and get no deltas.
+
+KPI_PERIOD_DAYS = 30  # Period the deltas compare against
+
+def dataset_fingerprint(df):
+    """Content hash of a frame, stable across processes and reloads"""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(repr([(column, str(dtype)) for column, dtype in df.dtypes.items()]).encode())
+    return digest.hexdigest()[:16]
+
+def property_kpis(properties_df):
+    """Headline property metrics"""
+    size = properties_df["size_sqft"].to_numpy(dtype=np.float64)
+    if not len(size):
+        return {"properties": 0, "occupancy": np.nan, "energy_rating": np.nan, "revenue": 0.0}
+    return {
+        "properties": len(size),
+        "occupancy": float(properties_df["occupancy_rate"].to_numpy(dtype=np.float64).mean()),
+        "energy_rating": float(properties_df["energy_rating"].to_numpy(dtype=np.float64).mean()),
+        "revenue": float(np.dot(properties_df["revenue_per_sqft"].to_numpy(dtype=np.float64), size))
+    }
+
+def active_tenants(tenants_df, as_of):
+    """Boolean mask of the tenants whose lease covers as_of"""
+    as_of = np.datetime64(pd.Timestamp(as_of), "ns")
+    lease_start = tenants_df["lease_start"].to_numpy(dtype="datetime64[ns]")
+    lease_end = tenants_df["lease_end"].to_numpy(dtype="datetime64[ns]")
+    return (lease_start <= as_of) & (as_of < lease_end)
+
+def tenant_kpis(tenants_df, as_of=None):
+    """Headline metrics of the tenants active at as_of (every tenant when unset)"""
+    if as_of is not None:
+        tenants_df = tenants_df[active_tenants(tenants_df, as_of)]
+    rent = tenants_df["monthly_rent"].to_numpy(dtype=np.float64)
+    if not len(rent):
+        return {"tenants": 0, "satisfaction": np.nan, "retention": np.nan, "monthly_rent": 0.0}
+    return {
+        "tenants": len(rent),
+        "satisfaction": float(tenants_df["satisfaction_score"].to_numpy(dtype=np.float64).mean()),
+        "retention": float(tenants_df["retention_probability"].to_numpy(dtype=np.float64).mean()),
+        "monthly_rent": float(rent.sum())
+    }
+
+def tenant_period_kpis(tenants_df, as_of, period_days=KPI_PERIOD_DAYS):
+    """(kpis of the tenants active at as_of, kpis of those active period_days earlier)"""
+    as_of = pd.Timestamp(as_of)
+    return tenant_kpis(tenants_df, as_of), tenant_kpis(tenants_df, as_of - pd.Timedelta(days=period_days))
+
+def kpi_deltas(kpis, prior):
+    """Percent change of each kpi against the prior period (None without one)"""
+    deltas = {}
+    for name, value in kpis.items():
+        previous = (prior or {}).get(name)
+        if previous is None or pd.isna(value) or pd.isna(previous) or not previous:
+            deltas[name] = None
+        else:
+            deltas[name] = round(100 * (value - previous) / abs(previous), 1)
+    return deltas
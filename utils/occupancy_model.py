@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+# ==== OCCUPANCY PREDICTOR ====
+# predicted = base x market x rental x improvements x marketing, capped to
+# [MIN_OCCUPANCY, MAX_OCCUPANCY]. OccupancySurface evaluates every combination of the
+# four inputs (each improvement subset separately) as one broadcast array, so
+# sensitivity and partial dependence are reductions over its axes. Input values off
+# the grid are evaluated directly instead of snapping to a neighbouring grid point.
+
+BASE_OCCUPANCY = 0.75
+MIN_OCCUPANCY, MAX_OCCUPANCY = 0.5, 0.98
+IMPROVEMENT_OPTIONS = ["Smart Building Features", "Renovated Common Areas", "Improved Amenities", "Sustainable Features", "Enhanced Security"]
+IMPROVEMENT_EFFECT = 0.02  # Occupancy multiplier added per improvement
+MARKET_DEMAND_LEVELS = np.arange(1, 11)
+RENTAL_ADJUSTMENTS = np.arange(-15.0, 16.0)  # %
+MARKETING_LEVELS = np.arange(1, 11)
+INPUTS = ["market_demand", "rental_adjustment", "improvements", "marketing_investment"]
+
+def occupancy_factors(market_demand, rental_adjustment, improvement_count, marketing_investment):
+    """(market, rental, improvement, marketing) multipliers; inputs may be arrays"""
+    market_factor = 0.5 + np.asarray(market_demand) / 20
+    rental_factor = 1.0 - np.asarray(rental_adjustment) / 100
+    improvement_factor = 1.0 + np.asarray(improvement_count) * IMPROVEMENT_EFFECT
+    marketing_factor = 0.9 + np.asarray(marketing_investment) / 50
+    return market_factor, rental_factor, improvement_factor, marketing_factor
+
+def predict_occupancy(market_demand, rental_adjustment, improvement_count, marketing_investment, base_occupancy=BASE_OCCUPANCY):
+    """Capped predicted occupancy; array inputs broadcast together"""
+    market, rental, improvement, marketing = occupancy_factors(market_demand, rental_adjustment, improvement_count, marketing_investment)
+    return np.clip(base_occupancy * market * rental * improvement * marketing, MIN_OCCUPANCY, MAX_OCCUPANCY)
+
+def improvement_subsets(options=IMPROVEMENT_OPTIONS):
+    """(subsets, options) boolean matrix of every subset; row i holds the options in the bits of i"""
+    return (np.arange(2 ** len(options))[:, None] >> np.arange(len(options))) & 1 == 1
+
+class OccupancySurface:
+    """Predicted occupancy over every input combination, shape (market, rental, subset, marketing)"""
+
+    def __init__(self, base_occupancy=BASE_OCCUPANCY):
+        self.base_occupancy = base_occupancy
+        self.subsets = improvement_subsets()
+        self.axes = {
+            "market_demand": MARKET_DEMAND_LEVELS,
+            "rental_adjustment": RENTAL_ADJUSTMENTS,
+            "improvements": np.arange(len(self.subsets)),
+            "marketing_investment": MARKETING_LEVELS
+        }
+        self.occupancy = predict_occupancy(
+            MARKET_DEMAND_LEVELS[:, None, None, None],
+            RENTAL_ADJUSTMENTS[None, :, None, None],
+            self.subsets.sum(axis=1)[None, None, :, None],
+            MARKETING_LEVELS[None, None, None, :],
+            base_occupancy
+        )
+
+    def _index(self, name, value):
+        """Grid index of an input value, or None when the value is not on the grid"""
+        axis = self.axes[name]
+        i = int(np.clip(np.searchsorted(axis, value), 1, len(axis) - 1))
+        i = i if abs(axis[i] - value) < abs(axis[i - 1] - value) else i - 1
+        return i if np.isclose(axis[i], value) else None
+
+    def _position(self, market_demand, rental_adjustment, improvements, marketing_investment):
+        """Index of one input combination, or None when any value is off the grid
+
+        improvements is a list of option names.
+        """
+        mask = sum(1 << IMPROVEMENT_OPTIONS.index(option) for option in set(improvements))
+        position = (
+            self._index("market_demand", market_demand),
+            self._index("rental_adjustment", rental_adjustment),
+            mask,
+            self._index("marketing_investment", marketing_investment)
+        )
+        return None if None in position else position
+
+    def _sweep(self, name, market_demand, rental_adjustment, improvements, marketing_investment):
+        """Occupancy along one input's grid with the others held, evaluated directly"""
+        inputs = {
+            "market_demand": market_demand,
+            "rental_adjustment": rental_adjustment,
+            "improvements": len(set(improvements)),
+            "marketing_investment": marketing_investment
+        }
+        inputs[name] = self.subsets.sum(axis=1) if name == "improvements" else self.axes[name]
+        return predict_occupancy(*(inputs[input_name] for input_name in INPUTS), self.base_occupancy)
+
+    def predict(self, market_demand, rental_adjustment, improvements, marketing_investment):
+        """Predicted occupancy of one input combination; off-grid values are evaluated directly"""
+        position = self._position(market_demand, rental_adjustment, improvements, marketing_investment)
+        if position is None:
+            return float(predict_occupancy(
+                market_demand, rental_adjustment, len(set(improvements)), marketing_investment, self.base_occupancy
+            ))
+        return float(self.occupancy[position])
+
+    def tornado(self, market_demand, rental_adjustment, improvements, marketing_investment):
+        """Occupancy range when one input (or one improvement) varies and the rest stay put, widest first"""
+        point = (market_demand, rental_adjustment, improvements, marketing_investment)
+        position = self._position(*point)
+        rows = []
+        for axis, name in enumerate(INPUTS):
+            if position is None:
+                line = self._sweep(name, *point)
+            else:
+                # Slice through the current point along one axis
+                line = self.occupancy[position[:axis] + (slice(None),) + position[axis + 1:]]
+            rows.append((name, line.min(), line.max()))
+        for option in IMPROVEMENT_OPTIONS:
+            others = [selected for selected in improvements if selected != option]
+            values = [
+                self.predict(market_demand, rental_adjustment, selection, marketing_investment)
+                for selection in (others, others + [option])
+            ]
+            rows.append((option, min(values), max(values)))
+        table = pd.DataFrame(rows, columns=["input", "low", "high"])
+        table["swing"] = table["high"] - table["low"]
+        return table.sort_values("swing", ascending=False, kind="stable", ignore_index=True)
+
+    def partial_dependence(self, name):
+        """Mean occupancy over every other input combination, per value of one input
+
+        Improvements are grouped by how many are selected.
+        """
+        axis = INPUTS.index(name)
+        others = tuple(i for i in range(len(INPUTS)) if i != axis)
+        curve = self.occupancy.mean(axis=others)
+        if name != "improvements":
+            return pd.Series(curve, index=pd.Index(self.axes[name], name=name))
+        counts = self.subsets.sum(axis=1)
+        return pd.Series(curve, index=pd.Index(counts, name="improvements")).groupby(level=0).mean()
@@ -0,0 +1,132 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ==== PORTFOLIO ENGINE ====
+# Precomputes per-property annual revenue and integer codes for city and type once,
+# so the portfolio -> city -> type -> property hierarchy aggregates with bincount,
+# top/bottom-N queries use argpartition and the property picker searches one
+# lowercase name array, all without touching per-property Python objects.
+
+LEVELS = {
+    "portfolio": [],
+    "city": ["location"],
+    "type": ["location", "type"]
+}
+RANK_METRICS = ["revenue", "revenue_per_sqft", "occupancy_rate", "energy_rating", "maintenance_score", "size_sqft"]
+AGGREGATE_COLUMNS = ["properties", "size_sqft", "revenue", "occupancy_rate", "revenue_per_sqft", "energy_rating"]
+PICKER_PAGE_SIZE = 50  # Properties listed per picker page
+SEARCH_CACHE_SIZE = 64  # Recent queries whose matches are kept
+
+class PortfolioEngine:
+    """Hierarchical aggregates, rankings and name search over a property table"""
+
+    def __init__(self, properties_df):
+        self.properties = properties_df.reset_index(drop=True)
+        self.size = self.properties["size_sqft"].to_numpy(dtype=np.float64)
+        self.metrics = {
+            "revenue": self.properties["revenue_per_sqft"].to_numpy(dtype=np.float64) * self.size,
+            **{
+                column: self.properties[column].to_numpy(dtype=np.float64)
+                for column in RANK_METRICS if column != "revenue"
+            }
+        }
+        self.codes, self.labels = {}, {}
+        for column in ("location", "type"):
+            self.codes[column], self.labels[column] = pd.factorize(self.properties[column], sort=True)
+        self.names = self.properties["name"].astype(str).str.lower().to_numpy()
+        self._aggregates = {}  # level -> aggregate frame
+        # Paging through one query re-reads the same matches; keyed by query only, so
+        # sessions sharing the engine never see each other's results
+        self._search = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._find)
+
+    def __len__(self):
+        return len(self.properties)
+
+    def aggregate(self, level="city"):
+        """Totals per node of a hierarchy level; occupancy is weighted by area"""
+        if level not in self._aggregates:
+            columns = LEVELS[level]
+            if columns:
+                shape = [len(self.labels[column]) for column in columns]
+                group = np.ravel_multi_index([self.codes[column] for column in columns], shape)
+            else:
+                shape, group = [1], np.zeros(len(self), dtype=np.int64)
+            bins = int(np.prod(shape))
+            count = np.bincount(group, minlength=bins)
+            size = np.bincount(group, self.size, bins)
+            revenue = np.bincount(group, self.metrics["revenue"], bins)
+            occupied = np.bincount(group, self.metrics["occupancy_rate"] * self.size, bins)
+            energy = np.bincount(group, self.metrics["energy_rating"], bins)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                table = pd.DataFrame({
+                    "properties": count,
+                    "size_sqft": size,
+                    "revenue": revenue,
+                    "occupancy_rate": occupied / size,
+                    "revenue_per_sqft": revenue / size,
+                    "energy_rating": energy / count
+                }, columns=AGGREGATE_COLUMNS)
+            if columns:
+                table.index = pd.MultiIndex.from_product([self.labels[column] for column in columns], names=columns)
+            else:
+                table.index = pd.Index(["Portfolio"], name="portfolio")
+            self._aggregates[level] = table[count > 0]
+        return self._aggregates[level]
+
+    def hierarchy(self):
+        """Portfolio -> city -> type nodes as (id, parent, label) rows for a treemap"""
+        portfolio = self.aggregate("portfolio").assign(id="Portfolio", parent="", label="Portfolio")
+        cities = self.aggregate("city").reset_index()
+        cities = cities.assign(id=cities["location"].astype(str), parent="Portfolio", label=cities["location"].astype(str))
+        types = self.aggregate("type").reset_index()
+        types = types.assign(
+            id=types["location"].astype(str) + "/" + types["type"].astype(str),
+            parent=types["location"].astype(str),
+            label=types["type"].astype(str)
+        )
+        columns = ["id", "parent", "label"] + AGGREGATE_COLUMNS
+        return pd.concat([frame[columns] for frame in (portfolio, cities, types)], ignore_index=True)
+
+    def _mask(self, city=None, property_type=None):
+        """Rows under one node of the hierarchy (all rows when unset)"""
+        mask = np.ones(len(self), dtype=bool)
+        for column, label in (("location", city), ("type", property_type)):
+            if label is not None:
+                position = self.labels[column].get_indexer([label])[0]
+                mask &= self.codes[column] == position
+        return mask
+
+    def rank(self, n=10, by="revenue", bottom=False, city=None, property_type=None):
+        """Top (or bottom) n properties by a metric, optionally under one city / type node"""
+        rows = np.flatnonzero(self._mask(city, property_type))
+        values = self.metrics[by][rows]
+        n = min(n, len(rows))
+        if n == 0:
+            return self.properties.iloc[:0].assign(revenue=[])
+        keys = values if bottom else -values
+        # Partial selection is O(rows); only the n winners get sorted
+        chosen = np.argpartition(keys, n - 1)[:n] if n < len(rows) else np.arange(len(rows))
+        chosen = chosen[np.argsort(keys[chosen], kind="stable")]
+        picked = rows[chosen]
+        return self.properties.iloc[picked].assign(revenue=self.metrics["revenue"][picked])
+
+    def _find(self, query):
+        """Read-only row positions of names containing a normalized query"""
+        if query:
+            rows = np.flatnonzero(pd.Series(self.names, copy=False).str.contains(query, regex=False).to_numpy())
+        else:
+            rows = np.arange(len(self))
+        rows.flags.writeable = False
+        return rows
+
+    def matches(self, query=""):
+        """Row positions of properties whose name contains query, case-insensitive"""
+        return self._search(query.strip().lower())
+
+    def search(self, query="", page=0, page_size=PICKER_PAGE_SIZE):
+        """(one page of properties matching query, total matches)"""
+        rows = self.matches(query)
+        start = page * page_size
+        return self.properties.iloc[rows[start:start + page_size]], len(rows)
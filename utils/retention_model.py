@@ -0,0 +1,158 @@
+import json
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from utils.storage import DATA_DIR
+
+# ==== TENANT RETENTION MODEL ====
+# L2-regularized logistic regression on standardized tenant features, fitted with
+# Newton steps (a handful of 6x6 solves), persisted as JSON under DATA_DIR/models and
+# scored in fixed-size chunks, so batch scoring stays a chunk of matrix-vector
+# products however many tenants there are.
+
+MODEL_DIR = DATA_DIR / "models"
+FEATURES = ["satisfaction_score", "service_requests_monthly", "rent_per_sqft", "lease_term_years", "months_to_expiration"]
+L2_PENALTY = 1e-3
+MAX_ITERATIONS = 25
+TOLERANCE = 1e-8
+HOLDOUT_SHARE = 0.2  # Tenants held out to evaluate the fitted model
+SCORE_CHUNK_ROWS = 1_000_000  # Tenants scored per matrix product
+
+def retention_features(tenants_df):
+    """(tenants, features) float64 matrix in FEATURES order"""
+    columns = {
+        "satisfaction_score": tenants_df["satisfaction_score"],
+        "service_requests_monthly": tenants_df["service_requests_monthly"],
+        "rent_per_sqft": np.log(tenants_df["monthly_rent"].to_numpy(dtype=np.float64) / tenants_df["space_utilized_sqft"].to_numpy()),
+        "lease_term_years": tenants_df["lease_term_years"],
+        "months_to_expiration": tenants_df["months_to_expiration"]
+    }
+    return np.column_stack([np.asarray(columns[feature], dtype=np.float64) for feature in FEATURES])
+
+def _sigmoid(z):
+    return 1 / (1 + np.exp(-np.clip(z, -35, 35)))
+
+def roc_auc(labels, scores):
+    """Area under the ROC curve from score ranks (ties get average ranks)"""
+    labels = np.asarray(labels, dtype=bool)
+    positives, negatives = labels.sum(), (~labels).sum()
+    if not positives or not negatives:
+        return np.nan
+    order = np.argsort(scores, kind="stable")
+    ranks = np.empty(len(scores))
+    ranks[order] = np.arange(1, len(scores) + 1)
+    # Average the ranks of tied scores
+    sorted_scores = np.asarray(scores)[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_scores)) + 1]
+    sizes = np.diff(np.r_[starts, len(scores)])
+    ranks[order] = np.repeat(starts + (sizes + 1) / 2, sizes)
+    return float((ranks[labels].sum() - positives * (positives + 1) / 2) / (positives * negatives))
+
+class RetentionModel:
+    """Logistic regression retention model over FEATURES"""
+
+    def __init__(self, coefficients=None, intercept=0.0, means=None, scales=None, metrics=None):
+        self.coefficients = None if coefficients is None else np.asarray(coefficients, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.means = None if means is None else np.asarray(means, dtype=np.float64)
+        self.scales = None if scales is None else np.asarray(scales, dtype=np.float64)
+        self.metrics = metrics or {}
+
+    def fit(self, features, labels, l2=L2_PENALTY):
+        """Fit by Newton-Raphson on standardized features; returns self"""
+        labels = np.asarray(labels, dtype=np.float64)
+        self.means = features.mean(axis=0)
+        self.scales = features.std(axis=0)
+        self.scales[self.scales == 0] = 1.0
+        design = np.column_stack([np.ones(len(features)), (features - self.means) / self.scales])
+        weights = np.zeros(design.shape[1])
+        penalty = np.full(design.shape[1], l2 * len(features))
+        penalty[0] = 0.0  # Intercept is not shrunk
+        for _ in range(MAX_ITERATIONS):
+            p = _sigmoid(design @ weights)
+            gradient = design.T @ (p - labels) + penalty * weights
+            hessian = (design * (p * (1 - p))[:, None]).T @ design + np.diag(penalty)
+            step = np.linalg.solve(hessian, gradient)
+            weights -= step
+            if np.abs(step).max() < TOLERANCE:
+                break
+        self.intercept, self.coefficients = float(weights[0]), weights[1:]
+        return self
+
+    def predict_proba(self, features):
+        """Retention probability of each row of a feature matrix"""
+        scores = np.empty(len(features))
+        for start in range(0, len(features), SCORE_CHUNK_ROWS):
+            chunk = features[start:start + SCORE_CHUNK_ROWS]
+            scores[start:start + len(chunk)] = _sigmoid(((chunk - self.means) / self.scales) @ self.coefficients + self.intercept)
+        return scores
+
+    def score(self, tenants_df):
+        """Retention probability of every tenant in a frame"""
+        return self.predict_proba(retention_features(tenants_df))
+
+    def evaluate(self, features, labels):
+        """Accuracy, AUC and log loss on labelled tenants"""
+        labels = np.asarray(labels, dtype=bool)
+        p = self.predict_proba(features)
+        eps = 1e-12
+        return {
+            "rows": int(len(labels)),
+            "accuracy": float(((p >= 0.5) == labels).mean()),
+            "auc": roc_auc(labels, p),
+            "log_loss": float(-np.mean(np.where(labels, np.log(p + eps), np.log(1 - p + eps))))
+        }
+
+    def drivers(self):
+        """{feature: standardized coefficient}, strongest effect first"""
+        order = np.argsort(-np.abs(self.coefficients), kind="stable")
+        return {FEATURES[i]: float(self.coefficients[i]) for i in order}
+
+    # ---- persistence ----
+
+    def save(self, path):
+        """Write the model as JSON, staging then renaming"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}-{uuid.uuid4().hex}")
+        with open(staging, "w") as f:
+            json.dump({
+                "features": FEATURES,
+                "coefficients": self.coefficients.tolist(),
+                "intercept": self.intercept,
+                "means": self.means.tolist(),
+                "scales": self.scales.tolist(),
+                "metrics": self.metrics
+            }, f)
+        os.replace(staging, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Read a model written by save()"""
+        with open(path) as f:
+            state = json.load(f)
+        if state["features"] != FEATURES:
+            raise ValueError(f"Model at {path} was trained on features {state['features']}, expected {FEATURES}")
+        return cls(state["coefficients"], state["intercept"], state["means"], state["scales"], state["metrics"])
+
+def train_retention_model(tenants_df, seed=None):
+    """Fit on a random share of labelled tenants and record holdout metrics"""
+    features, labels = retention_features(tenants_df), tenants_df["renewed"].to_numpy(dtype=bool)
+    holdout = np.random.default_rng(seed).random(len(labels)) < HOLDOUT_SHARE
+    model = RetentionModel().fit(features[~holdout], labels[~holdout])
+    model.metrics = model.evaluate(features[holdout], labels[holdout])
+    model.metrics["training_rows"] = int((~holdout).sum())
+    return model
+
+def load_or_train(key, load_labelled, seed=None, root=MODEL_DIR):
+    """Model persisted under key, training it on load_labelled() and saving it on first use"""
+    path = Path(root) / f"retention-{key}.json"
+    if path.exists():
+        return RetentionModel.load(path)
+    model = train_retention_model(load_labelled(), seed)
+    model.save(path)
+    return model
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+# ==== RING BUFFERS ====
+# The last `capacity` (timestamp, value) readings of every key live in one
+# preallocated row of two NumPy arrays. Appends overwrite the oldest slot and the
+# latest reading is read straight from the head, so neither grows with history.
+
+DEFAULT_CAPACITY = 1000  # Readings kept per key
+
+class RingBufferStore:
+    """Fixed-capacity per-key ring buffers of (timestamp, value) readings"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, initial_keys=8):
+        self.capacity = capacity
+        self.rows = {}  # key -> row in the arrays
+        self.timestamps = np.empty((initial_keys, capacity), dtype="datetime64[ns]")
+        self.values = np.empty((initial_keys, capacity), dtype=np.float64)
+        self.counts = np.zeros(initial_keys, dtype=np.int64)  # Readings ever appended per row
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def keys(self):
+        """Keys in first-seen order"""
+        return list(self.rows)
+
+    def _row(self, key):
+        """Row of a key, allocating (and doubling the arrays) for new keys"""
+        if key not in self.rows:
+            if len(self.rows) == len(self.counts):
+                grow = len(self.counts)
+                self.timestamps = np.concatenate([self.timestamps, np.empty_like(self.timestamps[:grow])])
+                self.values = np.concatenate([self.values, np.empty_like(self.values[:grow])])
+                self.counts = np.concatenate([self.counts, np.zeros(grow, dtype=np.int64)])
+            self.rows[key] = len(self.rows)
+        return self.rows[key]
+
+    def append(self, key, timestamp, value):
+        """Append one reading in O(1)"""
+        row = self._row(key)
+        slot = self.counts[row] % self.capacity
+        self.timestamps[row, slot] = np.datetime64(pd.Timestamp(timestamp), "ns")
+        self.values[row, slot] = value
+        self.counts[row] += 1
+
+    def extend(self, keys, timestamps, values):
+        """Append a batch of readings, kept in order within each key"""
+        codes, uniques = pd.factorize(pd.Series(list(keys), dtype=object))
+        if not len(codes):
+            return
+        rows = np.array([self._row(key) for key in uniques])[codes]
+        timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+        values = np.asarray(values, dtype=np.float64)
+
+        # Rank of each reading within its key; only the last `capacity` per key survive
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        group_starts = np.r_[0, np.flatnonzero(np.diff(sorted_rows)) + 1]
+        group_sizes = np.diff(np.r_[group_starts, len(order)])
+        rank = np.arange(len(order)) - np.repeat(group_starts, group_sizes)
+        keep = rank >= np.repeat(group_sizes, group_sizes) - self.capacity
+
+        slots = (self.counts[sorted_rows[keep]] + rank[keep]) % self.capacity
+        self.timestamps[sorted_rows[keep], slots] = timestamps[order[keep]]
+        self.values[sorted_rows[keep], slots] = values[order[keep]]
+        self.counts[sorted_rows[group_starts]] += group_sizes
+
+    def latest(self, key, default=None):
+        """Most recent (timestamp, value) of a key in O(1)"""
+        row = self.rows.get(key)
+        if row is None or not self.counts[row]:
+            return default
+        slot = (self.counts[row] - 1) % self.capacity
+        return pd.Timestamp(self.timestamps[row, slot]), float(self.values[row, slot])
+
+    def latest_all(self):
+        """(keys, timestamps, values) of the most recent reading of every key"""
+        rows = np.arange(len(self.rows))
+        slots = (self.counts[rows] - 1) % self.capacity
+        return self.keys(), self.timestamps[rows, slots], self.values[rows, slots]
+
+    def window(self, key, n=None):
+        """Last n readings of a key (all buffered by default), oldest first"""
+        row = self.rows.get(key)
+        if row is None:
+            return np.empty(0, dtype="datetime64[ns]"), np.empty(0)
+        size = min(self.counts[row], self.capacity, self.capacity if n is None else n)
+        slots = (self.counts[row] - size + np.arange(size)) % self.capacity
+        return self.timestamps[row, slots], self.values[row, slots]
@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+
+# ==== IOT ROLLUPS ====
+# Count / sum / min / max / sum-of-squares per (sensor_type, location, bucket),
+# materialized once per dataset and merged incrementally as readings arrive, so
+# page-level series and stats are O(buckets) lookups.
+
+ROLLUP_KEYS = ["sensor_type", "location"]
+ROLLUP_COLUMNS = ["count", "sum", "min", "max", "sumsq"]
+ROLLUP_FREQS = {
+    "hourly": np.timedelta64(1, "h"),
+    "daily": np.timedelta64(1, "D"),
+    "weekly": np.timedelta64(7, "D")
+}
+# 1970-01-01 was a Thursday; weekly buckets start on Mondays
+_WEEK_OFFSET = np.timedelta64(3, "D")
+
+def bucket_start(dates, freq):
+    """Floor datetime64 values to the start of their hourly, daily or weekly bucket"""
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    width = ROLLUP_FREQS[freq].astype("timedelta64[ns]")
+    offset = _WEEK_OFFSET.astype("timedelta64[ns]") if freq == "weekly" else np.timedelta64(0, "ns")
+    shifted = dates + offset
+    return shifted - (shifted - np.datetime64(0, "ns")) % width - offset
+
+def aggregate_readings(readings, freq):
+    """Roll raw readings up to one row per (sensor_type, location, bucket)"""
+    frame = pd.DataFrame({
+        "sensor_type": readings["sensor_type"].astype(str).to_numpy(),
+        "location": readings["location"].astype(str).to_numpy(),
+        "bucket": bucket_start(readings["date"].to_numpy(), freq),
+        "value": readings["value"].to_numpy(dtype=np.float64)
+    })
+    frame["sumsq"] = frame["value"] ** 2
+
+    grouped = frame.groupby(ROLLUP_KEYS + ["bucket"], sort=True)
+    table = grouped["value"].agg(["count", "sum", "min", "max"])
+    table["sumsq"] = grouped["sumsq"].sum()
+    return table
+
+class SensorRollupStore:
+    """Pre-aggregated IoT rollups at hourly, daily and weekly resolution"""
+
+    def __init__(self, freqs=tuple(ROLLUP_FREQS)):
+        empty = pd.DataFrame(
+            columns=ROLLUP_COLUMNS,
+            index=pd.MultiIndex.from_arrays([[], [], pd.DatetimeIndex([])], names=ROLLUP_KEYS + ["bucket"])
+        )
+        self.tables = {freq: empty.copy() for freq in freqs}
+        self.latest = {}  # (sensor_type, location) -> (timestamp, value)
+        self.units = {}  # sensor_type -> unit
+
+    def update(self, readings):
+        """Merge new readings into every rollup table"""
+        if readings.empty:
+            return self
+
+        for freq, table in self.tables.items():
+            partial = aggregate_readings(readings, freq)[ROLLUP_COLUMNS]
+            positions = table.index.get_indexer(partial.index)
+            existing = positions >= 0
+
+            # Buckets already present are combined on a copy of the table (so concurrent
+            # readers never see a half-merged table), new buckets are appended
+            if existing.any():
+                merged = table[ROLLUP_COLUMNS].to_numpy(dtype=np.float64, copy=True)
+                rows, incoming = positions[existing], partial.to_numpy(dtype=np.float64)[existing]
+                for i, column in enumerate(ROLLUP_COLUMNS):
+                    if column == "min":
+                        merged[rows, i] = np.minimum(merged[rows, i], incoming[:, i])
+                    elif column == "max":
+                        merged[rows, i] = np.maximum(merged[rows, i], incoming[:, i])
+                    else:
+                        merged[rows, i] += incoming[:, i]
+                table = pd.DataFrame(merged, index=table.index, columns=ROLLUP_COLUMNS)
+            if not existing.all():
+                table = pd.concat([table, partial[~existing]]).sort_index()
+            self.tables[freq] = table.astype(np.float64)
+
+        # Latest reading per (sensor_type, location)
+        order = np.argsort(readings["date"].to_numpy(), kind="stable")
+        last_rows = readings.iloc[order].groupby(ROLLUP_KEYS, observed=True).tail(1)
+        for row in last_rows.itertuples(index=False):
+            key = (str(row.sensor_type), str(row.location))
+            if key not in self.latest or row.date >= self.latest[key][0]:
+                self.latest[key] = (row.date, float(row.value))
+
+        if "unit" in readings:
+            units = readings[["sensor_type", "unit"]].drop_duplicates("sensor_type")
+            self.units.update(zip(units["sensor_type"].astype(str), units["unit"].astype(str)))
+        return self
+
+    def sensor_types(self):
+        """Sensor types present in the store"""
+        return sorted({sensor_type for sensor_type, _ in self.latest})
+
+    def locations(self):
+        """Locations present in the store"""
+        return sorted({location for _, location in self.latest})
+
+    def _slice(self, sensor_type, location, freq, start=None, end=None):
+        """Rows of one rollup table for a (sensor_type, location) pair, optionally limited to [start, end]"""
+        table = self.tables[freq]
+        try:
+            rows = table.xs((sensor_type, location), level=ROLLUP_KEYS)
+        except KeyError:
+            return table.iloc[:0].droplevel(ROLLUP_KEYS)
+        if start is None and end is None:
+            return rows
+
+        # Buckets are sorted, so the timeframe is a binary-searched slice
+        buckets = rows.index.to_numpy()
+        lo = 0 if start is None else np.searchsorted(buckets, bucket_start([pd.Timestamp(start)], freq)[0], side="left")
+        hi = len(buckets) if end is None else np.searchsorted(buckets, np.datetime64(pd.Timestamp(end), "ns"), side="right")
+        return rows.iloc[lo:hi]
+
+    def series(self, sensor_type, location, freq="daily", start=None, end=None):
+        """Per-bucket mean/min/max/count for a (sensor_type, location) pair"""
+        rows = self._slice(sensor_type, location, freq, start, end)
+        return pd.DataFrame({
+            "bucket": rows.index,
+            "value": (rows["sum"] / rows["count"]).to_numpy(),
+            "min": rows["min"].to_numpy(),
+            "max": rows["max"].to_numpy(),
+            "count": rows["count"].to_numpy()
+        })
+
+    def stats(self, sensor_type, location, start=None, end=None):
+        """Count, mean, std, min, max over [start, end] (whole history by default) and current value"""
+        # Weekly buckets are coarsest but only valid when the whole history is requested
+        freq = "weekly" if start is None and end is None and "weekly" in self.tables else "daily"
+        rows = self._slice(sensor_type, location, freq, start, end)
+        count, total, sumsq = rows["count"].sum(), rows["sum"].sum(), rows["sumsq"].sum()
+        mean = total / count if count else 0.0
+        # Sample standard deviation, matching pandas Series.std()
+        variance = (sumsq - count * mean ** 2) / (count - 1) if count > 1 else np.nan
+        return {
+            "count": int(count),
+            "mean": mean,
+            "std": float(np.sqrt(max(variance, 0.0))) if count > 1 else np.nan,
+            "min": rows["min"].min() if count else 0.0,
+            "max": rows["max"].max() if count else 0.0,
+            "current": self.latest.get((sensor_type, location), (None, 0.0))[1]
+        }
+
+    def snapshot(self, freq="hourly"):
+        """Latest bucket, previous bucket and baseline mean of every series in one pass"""
+        table = self.tables[freq]
+        if table.empty:
+            return pd.DataFrame(columns=["last_bucket", "current", "previous", "baseline"])
+        grouped = table.groupby(level=ROLLUP_KEYS, sort=True)
+        last = grouped.nth(-1)
+        previous = grouped.nth(-2)
+        totals = grouped[["sum", "count"]].sum()
+
+        keys = last.index.droplevel("bucket")
+        previous_keys = previous.index.droplevel("bucket")
+        previous_mean = pd.Series((previous["sum"] / previous["count"]).to_numpy(), index=previous_keys)
+        last_sum, last_count = last["sum"].to_numpy(), last["count"].to_numpy()
+        # Baseline is every bucket before the latest one
+        with np.errstate(divide="ignore", invalid="ignore"):
+            baseline = (totals["sum"].to_numpy() - last_sum) / (totals["count"].to_numpy() - last_count)
+        return pd.DataFrame({
+            "last_bucket": last.index.get_level_values("bucket"),
+            "current": last_sum / last_count,
+            "previous": previous_mean.reindex(keys).to_numpy(),
+            "baseline": baseline
+        }, index=keys)
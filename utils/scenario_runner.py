@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from utils.forecast import BAND_PERCENTILES, market_paths, revenue_bands, simulate_revenue
+
+# ==== PARALLEL SCENARIO RUNNER ====
+# Forecasts properties x scenarios across a process pool. Work is split into
+# (scenario, property block) shards; workers attach to a shared-memory array of
+# per-property percentiles by name and write their slice in place, and return only
+# their block's (paths x months) revenue total, which the parent folds into one
+# running total per scenario as shards finish. Shared memory therefore grows with the
+# property count alone. Every property of a scenario shares the same market growth and
+# occupancy draw per path, seeded by (seed, scenario), so portfolio bands carry the
+# market risk; only the monthly noise is drawn per property. The pool is created on
+# first use with spawned workers (forking Streamlit's threaded server can deadlock)
+# and reused across runs.
+# When a run is cancelled or interrupted (a Streamlit rerun raises inside the progress
+# callback), its pending shards are cancelled without waiting for the running ones.
+
+SHARD_PROPERTIES = 64  # Properties per shard
+RUNNER_PATHS = 1000  # Monte Carlo paths per property and scenario
+
+class RunCancelled(Exception):
+    """Raised when a scenario run is cancelled before all shards finish"""
+
+def _run_shard(annual_output, base_revenues, scenario, scenario_index, property_start,
+               horizon, num_paths, seed):
+    """Simulate one scenario for a block of properties; returns the block's (paths, months) revenue total"""
+    annual_name, annual_shape = annual_output
+    # Raises FileNotFoundError when the run was cancelled and its memory released
+    annual_block = shared_memory.SharedMemory(name=annual_name)
+    annual = np.ndarray(annual_shape, dtype=np.float64, buffer=annual_block.buf)
+    try:
+        growth_rate, occupancy_change, strategy_factor = scenario
+        # Redrawn identically by every shard of the scenario
+        market = market_paths(growth_rate, occupancy_change, num_paths, seed=(seed, scenario_index))
+        shard_total = np.zeros((num_paths, horizon))
+        for offset, base_revenue in enumerate(base_revenues):
+            property_index = property_start + offset
+            # Noise stream per (scenario, property): results do not depend on the sharding
+            paths = simulate_revenue(
+                growth_rate, occupancy_change, strategy_factor, horizon, num_paths,
+                seed=(seed, scenario_index, property_index), base_revenue=base_revenue, market=market
+            )
+            annual[scenario_index, property_index] = np.percentile(paths[:, :12].sum(axis=1), BAND_PERCENTILES)
+            shard_total += paths
+        return shard_total
+    finally:
+        del annual
+        annual_block.close()
+
+class ScenarioRunner:
+    """Runs forecast scenarios for many properties on a persistent process pool"""
+
+    def __init__(self, workers=None, shard_properties=SHARD_PROPERTIES, num_paths=RUNNER_PATHS):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_properties = shard_properties
+        self.num_paths = num_paths
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def pool(self):
+        """The shared worker pool, started on first use"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._pool
+
+    def close(self):
+        """Shut the worker pool down"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def run(self, base_revenues, scenarios, horizon=12, seed=None, progress=None, cancelled=None):
+        """Forecast every property under every (growth %, occupancy change %, strategy factor) scenario
+
+        Returns (annual, portfolio_bands): first-year revenue percentiles per scenario and
+        property, shape (scenarios, properties, len(BAND_PERCENTILES)), and the monthly
+        bands of total portfolio revenue for each scenario. progress(done, total) is called
+        as shards finish; cancelled() returning True stops the run with RunCancelled.
+        """
+        base_revenues = np.asarray(base_revenues, dtype=np.float64)
+        annual_shape = (len(scenarios), len(base_revenues), len(BAND_PERCENTILES))
+        block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(annual_shape)) * 8, 1))
+        tasks = [
+            ((block.name, annual_shape), base_revenues[start:start + self.shard_properties], tuple(scenario),
+             scenario_index, start, horizon, self.num_paths, seed)
+            for scenario_index, scenario in enumerate(scenarios)
+            for start in range(0, len(base_revenues), self.shard_properties)
+        ]
+        totals = np.zeros((len(scenarios), self.num_paths, horizon))
+        try:
+            if self.workers > 1 and len(tasks) > 1:
+                self._run_pool(tasks, totals, progress, cancelled)
+            else:
+                for done, task in enumerate(tasks, 1):
+                    if cancelled is not None and cancelled():
+                        raise RunCancelled()
+                    totals[task[3]] += _run_shard(*task)
+                    if progress is not None:
+                        progress(done, len(tasks))
+            annual = np.ndarray(annual_shape, dtype=np.float64, buffer=block.buf).copy()
+            return annual, [revenue_bands(total) for total in totals]
+        finally:
+            # Shards still running keep their own mapping; unlinking only drops the name
+            block.close()
+            block.unlink()
+
+    def _run_pool(self, tasks, totals, progress, cancelled):
+        """Run shards on the pool, folding each shard's total into its scenario as it finishes"""
+        futures = {self.pool().submit(_run_shard, *task): task[3] for task in tasks}
+        pending = set(futures)
+        try:
+            while pending:
+                if cancelled is not None and cancelled():
+                    raise RunCancelled()
+                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    totals[futures[future]] += future.result()
+                if finished and progress is not None:
+                    progress(len(tasks) - len(pending), len(tasks))
+        except BaseException:
+            # Drop the shards that have not started; running ones finish in the background
+            for future in pending:
+                future.cancel()
+            raise
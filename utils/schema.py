@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+# ==== DATASET SCHEMAS ====
+# Compact dtypes for every dashboard dataset: repeated labels as categoricals,
+# measurements as float32 and bounded counts and scores as small ints. Applied
+# whenever a dataset is written to or read from storage.
+
+SCHEMAS = {
+    "properties": {
+        "type": "category",
+        "location": "category",
+        "size_sqft": "int32",
+        "occupancy_rate": "float32",
+        "revenue_per_sqft": "float32",
+        "energy_rating": "int16",
+        "smart_devices": "int16",
+        "maintenance_score": "int16"
+    },
+    "iot": {
+        "sensor_id": "category",
+        "sensor_type": "category",
+        "value": "float32",
+        "unit": "category",
+        "location": "category"
+    },
+    "tenants": {
+        "business_type": "category",
+        "lease_term_years": "int16",
+        "monthly_rent": "int32",
+        "space_utilized_sqft": "int32",
+        "satisfaction_score": "int16",
+        "retention_probability": "float32",
+        "service_requests_monthly": "int16",
+        "months_to_expiration": "float32"
+    }
+}
+
+def apply_schema(df, name):
+    """Cast the columns of a dataset frame to their compact dtypes"""
+    casts = {
+        column: dtype for column, dtype in SCHEMAS[name].items()
+        if column in df and df[column].dtype.name != dtype
+    }
+    return df.astype(casts) if casts else df
+
+def drop_unused_categories(df):
+    """Remove categories with no rows left after filtering (plotly express groups by every category)"""
+    categorical = [column for column in df if isinstance(df[column].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return df
+    return df.assign(**{column: df[column].cat.remove_unused_categories() for column in categorical})
+
+def _widen(df):
+    """The same frame with object strings, float64 and int64 columns"""
+    wide = {}
+    for column in df:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            wide[column] = series.astype(object)
+        elif pd.api.types.is_float_dtype(series):
+            wide[column] = series.astype(np.float64)
+        elif pd.api.types.is_integer_dtype(series):
+            wide[column] = series.astype(np.int64)
+        else:
+            wide[column] = series
+    return pd.DataFrame(wide, index=df.index)
+
+def memory_report(frames):
+    """Deep memory use of each named frame against its object/float64/int64 equivalent"""
+    rows = []
+    for name, df in frames.items():
+        compact = df.memory_usage(deep=True).sum()
+        wide = _widen(df).memory_usage(deep=True).sum()
+        rows.append({
+            "dataset": name,
+            "rows": len(df),
+            "memory_mb": compact / 1e6,
+            "wide_memory_mb": wide / 1e6,
+            "saving_pct": 100 * (1 - compact / wide) if wide else 0.0
+        })
+    return pd.DataFrame(rows, columns=["dataset", "rows", "memory_mb", "wide_memory_mb", "saving_pct"])
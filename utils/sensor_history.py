@@ -0,0 +1,106 @@
+import json
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.storage import move_into_place
+
+# ==== MEMORY-MAPPED SENSOR HISTORY ====
+# One series per (sensor_type, location): a sorted datetime64[ns] timestamp array and
+# a value array, each saved as a fixed-width .npy file, plus a small JSON index.
+# Arrays are opened with mmap_mode="r", so every app process slices the same OS page
+# cache instead of holding its own copy of the history.
+
+HISTORY_INDEX = "index.json"
+
+def _constant_column(value, length):
+    """Categorical column repeating one value without materializing strings"""
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), [value])
+
+class SensorHistoryStore:
+    """Read-only, memory-mapped per-series sensor history"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / HISTORY_INDEX) as f:
+            self.index = {(entry["sensor_type"], entry["location"]): entry for entry in json.load(f)["series"]}
+        self._arrays = {}
+
+    @classmethod
+    def write(cls, readings, path):
+        """Split readings into per-series arrays on disk and open the result"""
+        path = Path(path)
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        staging.mkdir(parents=True)
+
+        type_codes, sensor_types = pd.factorize(readings["sensor_type"].astype(str), sort=True)
+        location_codes, locations = pd.factorize(readings["location"].astype(str), sort=True)
+        dates = readings["date"].to_numpy(dtype="datetime64[ns]")
+        values = readings["value"].to_numpy()
+        units = readings["unit"].astype(str).to_numpy() if "unit" in readings else None
+
+        # Group rows by series, time-ordered within each series
+        order = np.lexsort((dates, location_codes, type_codes))
+        series_codes = (type_codes * len(locations) + location_codes)[order]
+        bounds = np.flatnonzero(np.diff(series_codes)) + 1
+        starts, stops = np.r_[0, bounds], np.r_[bounds, len(order)]
+
+        series = []
+        for i, (lo, hi) in enumerate(zip(starts, stops)):
+            rows = order[lo:hi]
+            code = series_codes[lo]
+            np.save(staging / f"{i:04d}_date.npy", dates[rows])
+            np.save(staging / f"{i:04d}_value.npy", values[rows])
+            series.append({
+                "sensor_type": sensor_types[code // len(locations)],
+                "location": locations[code % len(locations)],
+                "unit": units[rows[0]] if units is not None else "",
+                "file": f"{i:04d}",
+                "count": int(hi - lo),
+                "first": str(dates[rows[0]]),
+                "last": str(dates[rows[-1]])
+            })
+
+        with open(staging / HISTORY_INDEX, "w") as f:
+            json.dump({"series": series}, f)
+
+        # Move the finished directory in, so readers never open a partial store
+        return cls(move_into_place(staging, path))
+
+    def series_keys(self):
+        """(sensor_type, location) pairs present in the store"""
+        return sorted(self.index)
+
+    def _columns(self, sensor_type, location):
+        """Memory-mapped (timestamps, values) arrays of one series"""
+        key = (sensor_type, location)
+        if key not in self._arrays:
+            if key not in self.index:
+                return np.empty(0, dtype="datetime64[ns]"), np.empty(0)
+            stem = self.index[key]["file"]
+            self._arrays[key] = (
+                np.load(self.path / f"{stem}_date.npy", mmap_mode="r"),
+                np.load(self.path / f"{stem}_value.npy", mmap_mode="r")
+            )
+        return self._arrays[key]
+
+    def window(self, sensor_type, location, start=None, end=None):
+        """Zero-copy (timestamps, values) views of one series inside [start, end]"""
+        dates, values = self._columns(sensor_type, location)
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "ns"), side="left")
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "ns"), side="right")
+        return dates[lo:hi], values[lo:hi]
+
+    def frame(self, sensor_type, location, start=None, end=None):
+        """Readings of one series inside [start, end] as a date, sensor_type, location, value, unit frame"""
+        dates, values = self.window(sensor_type, location, start, end)
+        unit = self.index.get((sensor_type, location), {}).get("unit", "")
+        return pd.DataFrame({
+            "date": dates,
+            "sensor_type": _constant_column(sensor_type, len(dates)),
+            "location": _constant_column(location, len(dates)),
+            "value": values,
+            "unit": _constant_column(unit, len(dates))
+        }, copy=False)
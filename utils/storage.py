@@ -0,0 +1,154 @@
+import json
+import shutil
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from utils.schema import apply_schema
+
+# ==== COLUMNAR STORAGE ====
+# Datasets are persisted as Parquet under DATA_DIR/<name>/<key>, one directory per
+# generator parameter set. IoT readings are hive-partitioned by day and sensor type,
+# so reads only open the partitions a predicate can match and only decode the
+# projected columns. Frames are cast to their compact schema on write and read.
+# Datasets that depend on the generation date carry an as_of parameter in their key;
+# writing a new day's copy removes the older days' copies of the same parameter set.
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+VERSION_PARAM = "as_of"  # Key parameter that dates a stored copy
+
+DATASET_LAYOUTS = {
+    "properties": {"partitions": [], "derived": [], "sort": []},
+    "iot": {"partitions": ["day", "sensor_type"], "derived": ["day"], "sort": ["date", "sensor_id"]},
+    "tenants": {"partitions": [], "derived": [], "sort": []}
+}
+
+def dataset_key(**params):
+    """Directory name for one generator parameter set"""
+    return "__".join(f"{name}-{value}" for name, value in sorted(params.items()))
+
+def dataset_path(name, key, root=DATA_DIR):
+    """Directory holding a persisted dataset"""
+    return Path(root) / name / key
+
+def _unversioned(key):
+    """A dataset key without its as_of parameter"""
+    return "__".join(part for part in key.split("__") if not part.startswith(f"{VERSION_PARAM}-"))
+
+def prune_versions(path):
+    """Remove the other as_of copies of the parameter set stored at path"""
+    path = Path(path)
+    base = _unversioned(path.name)
+    if base == path.name or not path.parent.is_dir():
+        return
+    for sibling in path.parent.iterdir():
+        # Staging directories start with "." and belong to in-flight writes
+        if sibling != path and not sibling.name.startswith(".") and _unversioned(sibling.name) == base:
+            shutil.rmtree(sibling, ignore_errors=True)
+
+def move_into_place(staging, path):
+    """Rename a finished staging directory to path, then prune older copies
+
+    Copies written under one key are identical, so when a concurrent writer got there
+    first its copy is kept and the staging directory is discarded.
+    """
+    try:
+        staging.rename(path)
+    except OSError:
+        if not path.is_dir():
+            raise
+        shutil.rmtree(staging, ignore_errors=True)
+    prune_versions(path)
+    return path
+
+def has_dataset(name, key, root=DATA_DIR):
+    """Whether a dataset has already been written"""
+    return dataset_path(name, key, root).is_dir()
+
+def _partitioning(name):
+    """Hive partitioning for a dataset, with partition values read back as categoricals"""
+    fields = DATASET_LAYOUTS[name]["partitions"]
+    if not fields:
+        return None
+    schema = pa.schema([(field, pa.dictionary(pa.int32(), pa.string())) for field in fields])
+    return ds.partitioning(schema, flavor="hive", dictionaries="infer")
+
+def _with_partition_columns(df, name):
+    """Add derived partition columns (the reading day for IoT) as categoricals"""
+    if "day" in DATASET_LAYOUTS[name]["derived"]:
+        # Format each distinct day once instead of every row
+        codes, days = pd.factorize(df["date"].dt.normalize())
+        df = df.assign(day=pd.Categorical.from_codes(codes, days.strftime("%Y-%m-%d")))
+    for field in DATASET_LAYOUTS[name]["partitions"]:
+        if not isinstance(df[field].dtype, pd.CategoricalDtype):
+            df = df.assign(**{field: df[field].astype(str).astype("category")})
+    return df
+
+def write_dataset(df, name, key, root=DATA_DIR):
+    """Write a frame as a (partitioned) Parquet dataset, keeping a copy already stored under key"""
+    path = dataset_path(name, key, root)
+    staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+
+    table = pa.Table.from_pandas(_with_partition_columns(apply_schema(df, name), name), preserve_index=False)
+    partitions = DATASET_LAYOUTS[name]["partitions"]
+    ds.write_dataset(
+        table,
+        staging,
+        format="parquet",
+        partitioning=partitions or None,
+        partitioning_flavor="hive" if partitions else None,
+        existing_data_behavior="overwrite_or_ignore"
+    )
+
+    # Write to a staging directory and move it in, so readers never see a partial dataset
+    return move_into_place(staging, path)
+
+def _stored_columns(dataset):
+    """Column order of the frame that was written (partition columns are otherwise moved last)"""
+    metadata = dataset.schema.metadata or {}
+    if b"pandas" not in metadata:
+        return dataset.schema.names
+    names = [column["name"] for column in json.loads(metadata[b"pandas"])["columns"]]
+    return [name for name in names if name in dataset.schema.names]
+
+def read_dataset(name, key, columns=None, filter=None, root=DATA_DIR):
+    """Read a dataset, decoding only the given columns and the partitions matching filter"""
+    dataset = ds.dataset(dataset_path(name, key, root), format="parquet", partitioning=_partitioning(name))
+    layout = DATASET_LAYOUTS[name]
+
+    if columns is None:
+        columns = [field for field in _stored_columns(dataset) if field not in layout["derived"]]
+    columns = list(columns)
+    sort_keys = [field for field in layout["sort"] if field in dataset.schema.names]
+    extra = [field for field in sort_keys if field not in columns]
+
+    df = dataset.to_table(columns=columns + extra, filter=filter).to_pandas()
+
+    # Partitions come back grouped by directory; restore the original row order
+    if sort_keys and len(df) > 1:
+        keys = [df[field].cat.codes.to_numpy() if isinstance(df[field].dtype, pd.CategoricalDtype) else df[field].to_numpy()
+                for field in reversed(sort_keys)]
+        df = df.iloc[np.lexsort(keys)].reset_index(drop=True)
+    return apply_schema(df[columns], name)
+
+def load_or_generate(name, key, generate, columns=None, filter=None, root=DATA_DIR):
+    """Read a persisted dataset, generating and writing it first if it is missing"""
+    if not has_dataset(name, key, root):
+        write_dataset(generate(), name, key, root)
+    return read_dataset(name, key, columns, filter, root)
+
+def date_filter(start=None, end=None, date_column="date"):
+    """Predicate on a date range that also prunes IoT day partitions"""
+    expression = None
+    if start is not None:
+        start = pd.Timestamp(start)
+        expression = (ds.field("day") >= start.strftime("%Y-%m-%d")) & (ds.field(date_column) >= start.to_datetime64())
+    if end is not None:
+        end = pd.Timestamp(end)
+        upper = (ds.field("day") <= end.strftime("%Y-%m-%d")) & (ds.field(date_column) <= end.to_datetime64())
+        expression = upper if expression is None else expression & upper
+    return expression